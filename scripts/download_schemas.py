@@ -7,11 +7,15 @@ saves them to src/ocsf/schemas/ for bundling with the package.
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import hashlib
+import io
 import json
+import multiprocessing
 import os
 import sys
-import tarfile
+import zipfile
 from io import BytesIO
 from pathlib import Path
 from typing import Any, cast
@@ -35,22 +39,38 @@ VERSIONS = [
 SCHEMA_CACHE_DIR = Path(__file__).parent.parent / ".schema_cache"
 OUTPUT_DIR = Path(__file__).parent.parent / "src" / "ocsf" / "schemas"
 
+# Archive members the parser keeps; everything else is never decompressed
+SCHEMA_DIRS = ("events", "objects", "categories")
+SCHEMA_FILES = ("dictionary.json", "categories.json", "version.json")
+
+# Schema collections stored one entry per line in the NDJSON cache
+CACHE_RECORD_KINDS = ("categories", "events", "objects", "enums")
+
 
 def load_cached_schema(version: str) -> dict[str, Any] | None:
     """Load schema from local cache directory.
 
+    The cache is NDJSON: a header line with the top-level schema keys, then one
+    line per entry of each collection in CACHE_RECORD_KINDS (see save_cached_schema).
+
     Args:
         version: Version string (e.g., "1.7.0")
 
     Returns:
         Parsed schema dict, or None if not found
     """
-    schema_file = SCHEMA_CACHE_DIR / f"ocsf-schema-v{version}.json"
+    schema_file = SCHEMA_CACHE_DIR / f"ocsf-schema-v{version}.ndjson"
 
     if schema_file.exists():
         print("    [*] Found schema in cache")
         with open(schema_file, encoding="utf-8") as f:
-            return cast(dict[str, Any], json.load(f))
+            schema = cast(dict[str, Any], json.loads(f.readline()))
+            for line in f:
+                record = json.loads(line)
+                kind = record.pop("_kind")
+                name = record.pop("_name")
+                schema[kind][name] = record
+            return schema
 
     return None
 
@@ -58,6 +78,9 @@ def load_cached_schema(version: str) -> dict[str, Any] | None:
 def save_cached_schema(version: str, schema: dict[str, Any]) -> None:
     """Save schema to local cache directory.
 
+    Each collection entry is written as its own line, so only one record is
+    encoded at a time rather than the whole schema tree.
+
     Args:
         version: Version string (e.g., "1.7.0")
         schema: Schema dictionary
@@ -65,12 +88,21 @@ def save_cached_schema(version: str, schema: dict[str, Any]) -> None:
     Returns:
         None
     """
-    schema_file = SCHEMA_CACHE_DIR / f"ocsf-schema-v{version}.json"
+    schema_file = SCHEMA_CACHE_DIR / f"ocsf-schema-v{version}.ndjson"
+
+    # Keep top-level key order; record collections start empty in the header
+    header = {key: {} if key in CACHE_RECORD_KINDS else value for key, value in schema.items()}
 
     with open(schema_file, "w", encoding="utf-8") as f:
-        return json.dump(schema, f)
+        f.write(json.dumps(header) + "\n")
+        for kind in CACHE_RECORD_KINDS:
+            for name, data in schema.get(kind, {}).items():
+                f.write(json.dumps({"_kind": kind, "_name": name, **data}) + "\n")
 
-    return None
+
+def schema_output_file(version: str) -> Path:
+    """Get the bundled schema path for a version (e.g., "1.7.0" -> v1_7_0.json)."""
+    return OUTPUT_DIR / f"v{version.replace('.', '_')}.json"
 
 
 def save_schema(version: str, schema: dict[str, Any]) -> Path:
@@ -85,10 +117,11 @@ def save_schema(version: str, schema: dict[str, Any]) -> Path:
     """
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    output_file = OUTPUT_DIR / f"v{version.replace('.', '_')}.json"
+    output_file = schema_output_file(version)
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(schema, f, indent=2)
+    # Encode once and write in a single call; json.dump() with indent issues a
+    # separate write for every token of the (multi-megabyte) document
+    output_file.write_text(json.dumps(schema, indent=2), encoding="utf-8")
 
     return output_file
 
@@ -109,15 +142,15 @@ def download_schema(version: str) -> dict[str, Any]:
         - "enums": dict (extracted from events/objects)
     """
     URL_PATTERNS = [
-        f"https://github.com/ocsf/ocsf-schema/archive/refs/tags/{version}.tar.gz",
-        f"https://github.com/ocsf/ocsf-schema/archive/refs/tags/v{version}.tar.gz",
+        f"https://github.com/ocsf/ocsf-schema/archive/refs/tags/{version}.zip",
+        f"https://github.com/ocsf/ocsf-schema/archive/refs/tags/v{version}.zip",
     ]
 
     if version == "dev":
-        URL_PATTERNS = ["https://github.com/ocsf/ocsf-schema/archive/refs/heads/main.tar.gz"]
+        URL_PATTERNS = ["https://github.com/ocsf/ocsf-schema/archive/refs/heads/main.zip"]
 
     for url in URL_PATTERNS:
-        # Download tarball
+        # Download zip archive
         print(f"    [*] Downloading {url}...", end=" ")
 
         with httpx.Client(follow_redirects=True, timeout=60.0) as client:
@@ -128,13 +161,13 @@ def download_schema(version: str) -> dict[str, Any]:
             response.raise_for_status()
 
         # Extract and parse
-        return _parse_tarball(response.content, version)
+        return _parse_zipfile(response.content, version)
 
     raise ValueError(version)
 
 
-def _parse_tarball(content: bytes, version: str) -> dict[str, Any]:
-    """Parse OCSF schema from tarball content."""
+def _parse_zipfile(content: bytes, version: str) -> dict[str, Any]:
+    """Parse OCSF schema from zip archive content."""
     schema: dict[str, Any] = {
         "version": version,
         "categories": {},
@@ -143,39 +176,36 @@ def _parse_tarball(content: bytes, version: str) -> dict[str, Any]:
         "enums": {},
     }
 
-    with tarfile.open(fileobj=BytesIO(content), mode="r:gz") as tar:
-        # Find the root directory name (e.g., "ocsf-schema-1.7.0")
-        root_dir = None
-        for member in tar.getmembers():
-            if member.isdir() and member.name.count("/") == 0:
-                root_dir = member.name
-                break
+    # The zip central directory lets us read just the members we need instead
+    # of decompressing every docs/metadata file in the archive.
+    with zipfile.ZipFile(BytesIO(content)) as zf:
+        names = zf.namelist()
 
+        # Find the root directory name (e.g., "ocsf-schema-1.7.0")
+        root_dir = names[0].partition("/")[0] if names else None
         if not root_dir:
-            raise ValueError("Could not find root directory in tarball")
+            raise ValueError("Could not find root directory in zip archive")
+        prefix = f"{root_dir}/"
 
         # Parse each schema component
-        for member in tar.getmembers():
-            if not member.isfile() or not member.name.endswith(".json"):
+        for name in names:
+            if not name.startswith(prefix) or not name.endswith(".json"):
                 continue
 
             # Get path relative to root
-            rel_path = member.name[len(root_dir) + 1 :]
-
-            # Extract and parse JSON
-            f = tar.extractfile(member)
-            if f is None:
+            rel_path = name[len(prefix) :]
+            item_type = rel_path.split("/")[0]
+            if item_type not in SCHEMA_DIRS and rel_path not in SCHEMA_FILES:
                 continue
 
             try:
-                data = json.loads(f.read().decode("utf-8"))
+                data = json.loads(zf.read(name))
             except json.JSONDecodeError:
                 print(f"    [!] Warning: Could not parse {rel_path}")
                 continue
 
             # Categorize by path
-            item_type = rel_path.split("/")[0]
-            if item_type in ("events", "objects", "categories"):
+            if item_type in SCHEMA_DIRS:
                 if "name" in data:
                     schema[item_type][data["name"]] = data
                 else:
@@ -184,35 +214,115 @@ def _parse_tarball(content: bytes, version: str) -> dict[str, Any]:
                     schema[item_type][filename] = data
             elif rel_path == "dictionary.json":
                 schema["dictionary"] = data
+                # Enums are typically defined in dictionary.json under "types"
+                # or inline within object/event attribute definitions. Pick them
+                # out of the tree we already hold rather than re-walking it later.
+                schema["enums"] = {
+                    name: type_def
+                    for name, type_def in data.get("types", {}).items()
+                    if "enum" in type_def
+                }
             elif rel_path == "categories.json":
                 schema["categories_meta"] = data
             elif rel_path == "version.json":
                 schema["version_info"] = data
 
-    # Enums are typically defined in dictionary.json under "types"
-    # or inline within object/event attribute definitions
-    if "dictionary" in schema and "types" in schema["dictionary"]:
-        for name, type_def in schema["dictionary"]["types"].items():
-            if "enum" in type_def:
-                schema["enums"][name] = type_def
-
     return schema
 
 
-def compute_checksum(file_path: Path) -> str:
-    """Compute SHA256 checksum of a file.
+def compute_checksum(schema: dict[str, Any]) -> str:
+    """Compute SHA256 checksum of a schema's canonical JSON form.
+
+    Hashes compact, key-sorted JSON so the checksum reflects schema content
+    only, and is cheap to compute compared to the indented file output.
 
     Args:
-        file_path: Path to file
+        schema: Schema dictionary
 
     Returns:
         Hex digest of SHA256 checksum
     """
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def load_checksums() -> dict[str, str]:
+    """Load checksums recorded by the previous run.
+
+    Returns:
+        Mapping of version to checksum, empty if no checksums file exists
+    """
+    checksums_file = OUTPUT_DIR / "checksums.json"
+    if not checksums_file.exists():
+        return {}
+
+    with open(checksums_file, encoding="utf-8") as f:
+        return cast(dict[str, str], json.load(f))
+
+
+def process_version(
+    version: str, previous_checksums: dict[str, str]
+) -> tuple[str, tuple[str, str] | None]:
+    """Load or download one schema version and save it to the output directory.
+
+    Runs in a worker process; versions have no data dependencies on each other.
+    Progress output is captured so the parent can print versions in order.
+
+    Args:
+        version: Version string (e.g., "1.7.0") or "dev"
+        previous_checksums: Checksums recorded by the previous run
+
+    Returns:
+        Tuple of (captured progress output, result of _process_version)
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = _process_version(version, previous_checksums)
+    return log.getvalue(), result
+
+
+def _process_version(version: str, previous_checksums: dict[str, str]) -> tuple[str, str] | None:
+    """Load or download one schema version and save it to the output directory.
+
+    The output file is only rewritten when the schema checksum has changed.
+
+    Args:
+        version: Version string (e.g., "1.7.0") or "dev"
+        previous_checksums: Checksums recorded by the previous run
+
+    Returns:
+        Tuple of (resolved version, checksum), or None if the version was skipped
+    """
+    verstr = "dev" if version == "dev" else f"v{version}"
+    print(f"[+] Processing {verstr}...")
+
+    # Load from cache unless it's dev
+    schema = load_cached_schema(version) if version != "dev" else None
+
+    if schema is None:
+        try:
+            schema = download_schema(version)
+        except Exception:
+            return None
+        else:
+            if version == "dev":
+                version = schema["version_info"]["version"]
+                schema["version"] = version
+            save_cached_schema(version, schema)
+
+    # Save to output directory, unless the existing output already matches
+    checksum = compute_checksum(schema)
+    if previous_checksums.get(version) == checksum and schema_output_file(version).exists():
+        print(f"    [*] {verstr} unchanged, skipping write")
+    else:
+        save_schema(version, schema)
+
+    # Get stats
+    num_objects = len(schema.get("objects", {}))
+    num_events = len(schema.get("events", {}))
+
+    print(f"    [*] {verstr} OK ({num_objects} objects, {num_events} events)")
+    return version, checksum
 
 
 def main() -> int:
@@ -229,42 +339,24 @@ def main() -> int:
     os.makedirs(SCHEMA_CACHE_DIR, exist_ok=True)
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    checksums = {}
-    success_count = 0
-    skip_count = 0
-
-    for version in VERSIONS:
-        verstr = "dev" if version == "dev" else f"v{version}"
-        print(f"[+] Processing {verstr}...")
+    previous_checksums = load_checksums()
 
-        # Load from cache unless it's dev
-        schema = load_cached_schema(version) if version != "dev" else None
+    # Each version is independent, so process them in parallel
+    processes = min(len(VERSIONS), os.cpu_count() or 1)
+    with multiprocessing.Pool(processes=processes) as pool:
+        results = pool.map(
+            functools.partial(process_version, previous_checksums=previous_checksums), VERSIONS
+        )
 
-        if schema is None:
-            try:
-                schema = download_schema(version)
-            except Exception:
-                skip_count += 1
-                continue
-            else:
-                if version == "dev":
-                    version = schema["version_info"]["version"]
-                    schema["version"] = version
-                save_cached_schema(version, schema)
-
-        # Save to output directory
-        output_file = save_schema(version, schema)
-
-        # Compute checksum
-        checksum = compute_checksum(output_file)
-        checksums[version] = checksum
-
-        # Get stats
-        num_objects = len(schema.get("objects", {}))
-        num_events = len(schema.get("events", {}))
-
-        print(f"    [*] OK ({num_objects} objects, {num_events} events)")
-        success_count += 1
+    checksums = {}
+    for log, result in results:
+        print(log, end="")
+        if result is not None:
+            version, checksum = result
+            checksums[version] = checksum
+
+    success_count = len(checksums)
+    skip_count = len(VERSIONS) - success_count
 
     # Save checksums
     checksums_file = OUTPUT_DIR / "checksums.json"
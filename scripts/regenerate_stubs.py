@@ -4,33 +4,141 @@
 This is a standalone script that doesn't depend on pydantic being installed.
 """
 
+import contextlib
+import hashlib
+import io
 import json
+import os
 import re
+import shutil
+import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 # Ensure UTF-8 encoding for stdout on Windows
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding="utf-8")
 
+# Precompiled patterns for the name conversion helpers
+_LABEL_UNDERSCORE_RUNS = re.compile(r"_+")
+_PASCAL_WORD_BOUNDARY = re.compile(r"(.)([A-Z][a-z]+)")
+_PASCAL_CASE_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+
+# label_to_enum_name translation over ASCII: whitespace and hyphens become "_",
+# letters are uppercased and any other punctuation is dropped, in one pass
+_ENUM_NAME_TABLE = str.maketrans(
+    {
+        c: "_" if c.isspace() or c == "-" else c.upper() if c.isalnum() or c == "_" else None
+        for c in map(chr, range(128))
+    }
+)
 
+# Python reserved keywords that need underscore suffix
+RESERVED_KEYWORDS = frozenset(
+    {
+        "False",
+        "None",
+        "True",
+        "and",
+        "as",
+        "assert",
+        "async",
+        "await",
+        "break",
+        "class",
+        "continue",
+        "def",
+        "del",
+        "elif",
+        "else",
+        "except",
+        "finally",
+        "for",
+        "from",
+        "global",
+        "if",
+        "import",
+        "in",
+        "is",
+        "lambda",
+        "nonlocal",
+        "not",
+        "or",
+        "pass",
+        "raise",
+        "return",
+        "try",
+        "while",
+        "with",
+        "yield",
+        "type",
+    }
+)
+# Case-insensitive lookup set; covers every exact-case keyword as well
+RESERVED_KEYWORDS_LOWER = frozenset(k.lower() for k in RESERVED_KEYWORDS)
+
+# Field names the class stubs skip entirely
+SKIPPED_FIELD_NAMES = frozenset({"class", "type", "import", "from", "def", "return", "if", "else"})
+
+# Map OCSF types to Python types
+# Includes both primitive types and constrained string types (email_t, url_t, etc.)
+OCSF_TYPE_MAP: dict[str, str] = {
+    # Core primitives
+    "string_t": "str",
+    "integer_t": "int",
+    "long_t": "int",
+    "float_t": "float",
+    "boolean_t": "bool",
+    "timestamp_t": "int",
+    "datetime_t": "str",
+    "json_t": "dict[str, Any]",
+    "object_t": "dict[str, Any]",
+    # Constrained string types (all resolve to str in Python)
+    "email_t": "str",
+    "file_path_t": "str",
+    "file_name_t": "str",
+    "file_hash_t": "str",
+    "hostname_t": "str",
+    "ip_t": "str",
+    "mac_t": "str",
+    "subnet_t": "str",
+    "url_t": "str",
+    "uuid_t": "str",
+    "resource_uid_t": "str",
+    "process_name_t": "str",
+    "username_t": "str",
+    # Port is numeric
+    "port_t": "int",
+}
+
+
+@cache
 def snake_to_pascal(name: str) -> str:
-    """Convert snake_case to PascalCase."""
-    return "".join(word.capitalize() for word in name.split("_"))
+    """Convert snake_case to PascalCase.
+
+    The result is interned: the same model/enum names recur across every
+    class and schema version, so they share one string object.
+    """
+    return sys.intern("".join(word.capitalize() for word in name.split("_")))
 
 
+@cache
 def label_to_enum_name(label: str) -> str:
-    """Convert enum label to UPPER_SNAKE_CASE member name."""
-    name = re.sub(r"[\s\-]+", "_", label)
-    name = re.sub(r"[^a-zA-Z0-9_]", "", name)
-    name = name.upper().strip("_")
-    name = re.sub(r"_+", "_", name)
+    """Convert enum label to UPPER_SNAKE_CASE member name (interned)."""
+    name = label.translate(_ENUM_NAME_TABLE)
+    if not name.isascii():
+        # Rare: Unicode whitespace still separates words, anything else non-ASCII is dropped
+        name = "".join("_" if c.isspace() else c for c in name if c.isascii() or c.isspace())
+    name = _LABEL_UNDERSCORE_RUNS.sub("_", name).strip("_")
 
     if name and name[0].isdigit():
         name = f"VALUE_{name}"
 
-    return name or "UNKNOWN"
+    return sys.intern(name or "UNKNOWN")
 
 
 def infer_sibling_label_field(id_field: str) -> str:
@@ -62,53 +170,14 @@ def infer_sibling_label_field(id_field: str) -> str:
     # Remove "_id" suffix to get base name
     base = id_field[:-3]
 
-    # Python reserved keywords that need underscore suffix
-    RESERVED_KEYWORDS = {
-        "False",
-        "None",
-        "True",
-        "and",
-        "as",
-        "assert",
-        "async",
-        "await",
-        "break",
-        "class",
-        "continue",
-        "def",
-        "del",
-        "elif",
-        "else",
-        "except",
-        "finally",
-        "for",
-        "from",
-        "global",
-        "if",
-        "import",
-        "in",
-        "is",
-        "lambda",
-        "nonlocal",
-        "not",
-        "or",
-        "pass",
-        "raise",
-        "return",
-        "try",
-        "while",
-        "with",
-        "yield",
-        "type",
-    }
-
     # Check if base name is a reserved keyword
-    if base in RESERVED_KEYWORDS or base.lower() in {k.lower() for k in RESERVED_KEYWORDS}:
+    if base.lower() in RESERVED_KEYWORDS_LOWER:
         return f"{base}_"
 
     return base
 
 
+@cache
 def pascal_to_snake(name: str) -> str:
     """Convert PascalCase to snake_case.
 
@@ -117,50 +186,91 @@ def pascal_to_snake(name: str) -> str:
         SeverityId -> severity_id
         TypeId -> type_id
     """
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _PASCAL_WORD_BOUNDARY.sub(r"\1_\2", name)
+    return _PASCAL_CASE_BOUNDARY.sub(r"\1_\2", s1).lower()
+
+
+# Header shared by objects.pyi and events.pyi, filled in once per file kind
+_STUB_HEADER_TEMPLATE = (
+    '"""{title} - Type stubs (auto-generated)."""\n'
+    "\n"
+    "from __future__ import annotations\n"
+    "\n"
+    "from typing import {typing_names}\n"
+    "\n"
+    "from pydantic import SerializeAsAny\n"
+    "from typing_extensions import Self\n"
+    "\n"
+    "from ocsf._base import OCSFBaseModel\n"
+    "from ocsf._sibling_enum import SiblingEnum\n"
+)
+OBJECTS_STUB_HEADER = _STUB_HEADER_TEMPLATE.format(title="OCSF Objects", typing_names="Any")
+EVENTS_STUB_HEADER = _STUB_HEADER_TEMPLATE.format(
+    title="OCSF Events", typing_names="TYPE_CHECKING, Any"
+)
+
+
+# Per-kind settings for _generate_namespace_stub: (header, is_event)
+_STUB_KINDS: dict[str, tuple[str, bool]] = {
+    "objects": (OBJECTS_STUB_HEADER, False),
+    "events": (EVENTS_STUB_HEADER, True),
+}
+
+
+def generate_objects_stub(version: str, schema: dict[str, Any], output_dir: Path) -> Path:
+    """Generate objects.pyi stub file."""
+    return _generate_namespace_stub(schema, output_dir, "objects")
 
 
-def generate_objects_stub(version: str, schema: dict[str, Any], output_dir: Path) -> None:
-    """Generate objects.pyi stub file."""
-    lines = [
-        '"""OCSF Objects - Type stubs (auto-generated)."""',
-        "",
-        "from __future__ import annotations",
-        "",
-        "from typing import Any",
-        "",
-        "from pydantic import SerializeAsAny",
-        "from typing_extensions import Self",
-        "",
-        "from ocsf._base import OCSFBaseModel",
-        "from ocsf._sibling_enum import SiblingEnum",
-        "",
-    ]
+def generate_events_stub(version: str, schema: dict[str, Any], output_dir: Path) -> Path:
+    """Generate events.pyi stub file."""
+    return _generate_namespace_stub(schema, output_dir, "events")
 
-    dict_attributes = schema.get("dictionary", {}).get("attributes", {})
-    all_objects = schema.get("objects", {})
 
-    # Generate ONLY object stubs
-    for obj_name, obj_spec in sorted(all_objects.items()):
-        lines.extend(
-            _generate_class_stub(
-                obj_name, obj_spec, dict_attributes, all_objects, is_event=False, full_schema=schema
-            )
+def _generate_namespace_stub(
+    schema: dict[str, Any], output_dir: Path, kind: Literal["objects", "events"]
+) -> Path:
+    """Generate the stub file for one namespace module (objects.pyi or events.pyi)."""
+    header, is_event = _STUB_KINDS[kind]
+    dict_attributes = schema.get("dictionary", {}).get("attributes", {})
+    all_specs = schema.get(kind, {})
+
+    buf = io.StringIO()
+    buf.write(header)
+
+    if is_event:
+        _write_object_imports(buf, all_specs, schema.get("objects", {}))
+
+    # Parent requirement lookups, shared by all classes in this file
+    req_cache: dict[tuple[str, str], Optional[str]] = {}
+
+    # Generate ONLY this namespace's stubs, separated by a blank line
+    for class_name, class_spec in sorted(all_specs.items()):
+        buf.write("\n")
+        _generate_class_stub(
+            buf,
+            class_name,
+            class_spec,
+            dict_attributes,
+            all_specs,
+            is_event=is_event,
+            full_schema=schema,
+            req_cache=req_cache,
         )
-        lines.append("")
-
-    output_path = output_dir / "objects.pyi"
-    output_path.write_text("\n".join(lines))
-    print(f"  Generated objects.pyi: {len(lines)} lines")
 
+    file_name = f"{kind}.pyi"
+    output_path = output_dir / file_name
+    content = format_stub(buf.getvalue(), output_path)
+    status = "Generated" if _write_if_changed(output_path, content) else "Unchanged"
+    num_lines = content.count("\n")
+    print(f"  {status} {file_name}: {num_lines} lines")
+    return output_path
 
-def generate_events_stub(version: str, schema: dict[str, Any], output_dir: Path) -> None:
-    """Generate events.pyi stub file."""
-    dict_attributes = schema.get("dictionary", {}).get("attributes", {})
-    all_events = schema.get("events", {})
-    all_objects = schema.get("objects", {})
 
+def _write_object_imports(
+    buf: io.StringIO, all_events: dict[str, Any], all_objects: dict[str, Any]
+) -> None:
+    """Write the TYPE_CHECKING import of object types used by the event stubs."""
     # Find name collisions between objects and events
     event_names = {snake_to_pascal(name) for name in all_events}
     object_names = {snake_to_pascal(name) for name in all_objects}
@@ -169,72 +279,40 @@ def generate_events_stub(version: str, schema: dict[str, Any], output_dir: Path)
     # Build explicit import list for non-colliding object types
     importable_objects = sorted(object_names - collisions)
 
-    lines = [
-        '"""OCSF Events - Type stubs (auto-generated)."""',
-        "",
-        "from __future__ import annotations",
-        "",
-        "from typing import TYPE_CHECKING, Any",
-        "",
-        "from pydantic import SerializeAsAny",
-        "from typing_extensions import Self",
-        "",
-        "from ocsf._base import OCSFBaseModel",
-        "from ocsf._sibling_enum import SiblingEnum",
-        "",
-    ]
-
     # Add TYPE_CHECKING import for object types
     if importable_objects:
-        lines.append("if TYPE_CHECKING:")
-        lines.append("    # Import object types for type checking (excluding name collisions)")
+        buf.write("\n")
+        buf.write("if TYPE_CHECKING:\n")
+        buf.write("    # Import object types for type checking (excluding name collisions)\n")
         # Use a single import statement with parentheses for better formatting
-        lines.append("    from .objects import (")
-        for i, obj in enumerate(importable_objects):
-            # Add comma to all but the last item
-            if i < len(importable_objects) - 1:
-                lines.append(f"        {obj},")
-            else:
-                lines.append(f"        {obj},")
-        lines.append("    )")
-        lines.append("")
-
-    # Generate ONLY event stubs
-    for event_name, event_spec in sorted(all_events.items()):
-        lines.extend(
-            _generate_class_stub(
-                event_name,
-                event_spec,
-                dict_attributes,
-                all_events,
-                is_event=True,
-                full_schema=schema,
-            )
-        )
-        lines.append("")
-
-    output_path = output_dir / "events.pyi"
-    output_path.write_text("\n".join(lines))
-    print(f"  Generated events.pyi: {len(lines)} lines")
-
-
-def generate_init_stub(version: str, schema: dict[str, Any], output_dir: Path) -> None:
+        buf.write("    from .objects import (\n")
+        for obj in importable_objects:
+            buf.write(f"        {obj},\n")
+        buf.write("    )\n")
+
+
+# The version package stub is identical for every version
+INIT_STUB = (
+    '"""OCSF Models - Type stubs (auto-generated)."""\n'
+    "\n"
+    "from __future__ import annotations\n"
+    "\n"
+    "# Namespace modules only - import from .objects or .events\n"
+    "from . import events as events\n"
+    "from . import objects as objects\n"
+    "\n"
+    "__all__ = ['objects', 'events']"
+)
+
+
+def generate_init_stub(version: str, schema: dict[str, Any], output_dir: Path) -> Path:
     """Generate __init__.pyi that only exposes namespace modules."""
-    lines = [
-        '"""OCSF Models - Type stubs (auto-generated)."""',
-        "",
-        "from __future__ import annotations",
-        "",
-        "# Namespace modules only - import from .objects or .events",
-        "from . import events as events",
-        "from . import objects as objects",
-        "",
-        "__all__ = ['objects', 'events']",
-    ]
-
     output_path = output_dir / "__init__.pyi"
-    output_path.write_text("\n".join(lines))
-    print(f"  Generated __init__.pyi: {len(lines)} lines")
+    content = format_stub(INIT_STUB, output_path)
+    status = "Generated" if _write_if_changed(output_path, content) else "Unchanged"
+    num_lines = content.count("\n")
+    print(f"  {status} __init__.pyi: {num_lines} lines")
+    return output_path
 
 
 def _get_parent_requirement(
@@ -242,75 +320,86 @@ def _get_parent_requirement(
     spec: dict[str, Any],
     dict_attributes: dict[str, Any],
     all_specs: dict[str, Any],
+    req_cache: Optional[dict[tuple[str, str], Optional[str]]] = None,
 ) -> Optional[str]:
     """Get the requirement status of a field from parent class hierarchy.
 
     Returns 'required', 'optional', 'recommended', or None if field not found in parent.
+    Results are memoized in req_cache by (ancestor, field), for every ancestor walked.
     """
     if "extends" not in spec:
         return None
 
+    if req_cache is None:
+        req_cache = {}
+
     parent_name = spec["extends"]
+    dict_field = dict_attributes.get(field_name, {})
+    walked: list[str] = []
+    req: Optional[str] = None
 
     # Recursively check parent hierarchy
     while parent_name:
+        key = (parent_name, field_name)
+        if key in req_cache:
+            req = req_cache[key]
+            break
+        walked.append(parent_name)
+
         parent_spec = all_specs.get(parent_name, {})
         parent_attrs = parent_spec.get("attributes", {})
 
         if field_name in parent_attrs:
             parent_field = parent_attrs[field_name]
-            if isinstance(parent_field, dict):
-                # Merge with dictionary to get full spec
-                merged = {**dict_attributes.get(field_name, {}), **parent_field}
-                if "requirement" in merged:
-                    req: Optional[str] = merged.get("requirement")
-                    return req
+            if isinstance(parent_field, dict) and (
+                "requirement" in parent_field or "requirement" in dict_field
+            ):
+                # Parent's own requirement wins over the dictionary's (no merged copy)
+                req = parent_field.get("requirement", dict_field.get("requirement"))
+                break
 
         # Move up the hierarchy
         parent_name = parent_spec.get("extends")
 
-    return None
+    # Every ancestor walked resolves the same way for this field
+    for name in walked:
+        req_cache[(name, field_name)] = req
+
+    return req
 
 
 def _generate_class_stub(
+    buf: io.StringIO,
     name: str,
     spec: dict[str, Any],
     dict_attributes: dict[str, Any],
     all_specs: dict[str, Any],
     is_event: bool = False,
     full_schema: Optional[dict[str, Any]] = None,
-) -> list[str]:
-    """Generate stub lines for a single class."""
-    lines = []
-
+    req_cache: Optional[dict[tuple[str, str], Optional[str]]] = None,
+) -> None:
+    """Write stub lines for a single class into buf."""
     # Class declaration
     model_name = snake_to_pascal(name)
 
     if "extends" in spec:
         base_name = snake_to_pascal(spec["extends"])
-        lines.append(f"class {model_name}({base_name}):")
+        buf.write(f"class {model_name}({base_name}):\n")
     else:
-        lines.append(f"class {model_name}(OCSFBaseModel):")
+        buf.write(f"class {model_name}(OCSFBaseModel):\n")
 
-    # Extract and generate enums
     attributes = spec.get("attributes", {})
-    enums_to_generate = []
-
-    for field_name, field_spec in attributes.items():
-        if not isinstance(field_spec, dict):
-            continue
 
-        # Merge with dictionary
-        merged_spec = {**dict_attributes.get(field_name, {}), **field_spec}
-
-        # Check for sibling enum
-        if "enum" in merged_spec and field_name.endswith("_id"):
-            enum_name = snake_to_pascal(field_name)
-            enum_values = merged_spec["enum"]
-            enums_to_generate.append((enum_name, enum_values))
+    # Merge each field with its dictionary definition once, for both passes below
+    merged_specs = {
+        field_name: {**dict_attributes.get(field_name, {}), **field_spec}
+        for field_name, field_spec in attributes.items()
+        if isinstance(field_spec, dict)
+    }
 
     # Special case: Observable.TypeId is a derived enum
     # Its values are collected from all "observable" field definitions across the schema
+    derived_type_id_enum = None
     if name == "observable" and full_schema is not None and "type_id" in attributes:
         # Import the extraction function
         import sys
@@ -326,73 +415,58 @@ def _generate_class_stub(
         # Extract all observable type_id values from the entire schema
         observable_types = extract_observable_type_ids(full_schema)
 
-        # Replace the TypeId enum in enums_to_generate with the derived version
-        enums_to_generate = [
-            (enum_name, enum_vals)
-            for enum_name, enum_vals in enums_to_generate
-            if enum_name != "TypeId"
-        ]
-        # Add the derived TypeId enum
         # Convert dict[int, str] to dict[str, dict] format expected by stub generation
-        derived_enum = {
+        derived_type_id_enum = {
             str(type_id): {"caption": caption} for type_id, caption in observable_types.items()
         }
-        enums_to_generate.append(("TypeId", derived_enum))
 
-    # Generate nested enum classes and track sibling ID fields
+    # Generate nested enum classes directly into the buffer and track sibling ID fields
+    has_enums = False
     sibling_id_fields = []  # Track ID fields that have enums
-    for enum_name, enum_values in enums_to_generate:
-        lines.append(f"    class {enum_name}(SiblingEnum):")
-
-        # Generate enum members with actual values
-        for value_key, value_data in sorted(enum_values.items(), key=lambda x: int(x[0])):
-            try:
-                int_value = int(value_key)
-                label = value_data.get("caption", str(int_value))
-                member_name = label_to_enum_name(label)
-                lines.append(f"        {member_name} = {int_value}")
-            except (ValueError, AttributeError):
-                continue
+    enum_id_fields = set()  # _id fields whose merged spec has an enum, for the field pass
+    for field_name, merged_spec in merged_specs.items():
+        if "enum" in merged_spec and field_name.endswith("_id"):
+            enum_id_fields.add(field_name)
 
-        # Add OTHER if not present
-        if "99" not in enum_values:
-            lines.append("        OTHER = 99")
+        if field_name == "type_id" and derived_type_id_enum is not None:
+            enum_values = derived_type_id_enum
+        elif field_name in enum_id_fields:
+            enum_values = merged_spec["enum"]
+        else:
+            continue
 
-        lines.append("        @property")
-        lines.append("        def label(self) -> str: ...")
-        lines.append("        @classmethod")
-        lines.append("        def from_label(cls, label: str) -> Self: ...")
-        lines.append("")
+        _write_enum_stub(buf, snake_to_pascal(field_name), enum_values)
+        has_enums = True
 
-        # Track the field name this enum is for (e.g., ActivityId -> activity_id)
-        field_name = pascal_to_snake(enum_name)
-        if field_name.endswith("_id"):
-            sibling_id_fields.append(field_name)
+        # Track the ID field this enum is for (every branch above is an _id field)
+        sibling_id_fields.append(field_name)
 
     # Generate field stubs
     has_fields = False
     processed_fields = set()  # Track which fields we've already generated
-    RESERVED = {"class", "type", "import", "from", "def", "return", "if", "else"}
 
-    for field_name, field_spec in sorted(attributes.items()):
-        if not isinstance(field_spec, dict) or field_name.startswith("$"):
+    # merged_specs already holds only dict-valued fields, so just sort its keys
+    for field_name in sorted(merged_specs):
+        if field_name.startswith("$"):
             continue
 
-        if field_name in RESERVED:
+        if field_name in SKIPPED_FIELD_NAMES:
             continue  # Skip reserved keywords
 
-        # Merge with dictionary
-        merged_spec = {**dict_attributes.get(field_name, {}), **field_spec}
+        field_spec = attributes[field_name]
+        merged_spec = merged_specs[field_name]
 
         # Check if field only provides enum metadata (child extending parent's field)
-        has_enum = "enum" in merged_spec and field_name.endswith("_id")
+        has_enum = field_name in enum_id_fields
         only_enum = has_enum and "requirement" not in field_spec and "extends" in spec
 
         # Skip field if it only provides enum (inherits from parent)
         # But keep the enum class which was already generated above
         if only_enum:
             # Check if parent actually defines this field
-            parent_req = _get_parent_requirement(field_name, spec, dict_attributes, all_specs)
+            parent_req = _get_parent_requirement(
+                field_name, spec, dict_attributes, all_specs, req_cache
+            )
             if parent_req is not None:
                 # Parent defines it, skip redefinition
                 continue
@@ -409,15 +483,13 @@ def _generate_class_stub(
         if is_event and field_name in ("category_uid", "class_uid", "type_uid"):
             is_required = False
 
-        # Add None for optional fields if not already included
-        if not is_required and "| None" not in type_annotation:
-            type_annotation = f"{type_annotation} | None"
-
         # Check if this creates a type incompatibility with parent class
         # (making a required field optional is a known issue in OCSF schemas)
         needs_type_ignore = False
         if not is_required and "extends" in spec:
-            parent_req = _get_parent_requirement(field_name, spec, dict_attributes, all_specs)
+            parent_req = _get_parent_requirement(
+                field_name, spec, dict_attributes, all_specs, req_cache
+            )
             if parent_req == "required":
                 # Parent requires this field, but child makes it optional
                 # This is a schema design issue - add type ignore comment
@@ -426,9 +498,10 @@ def _generate_class_stub(
         type_ignore_comment = "  # type: ignore[assignment]" if needs_type_ignore else ""
 
         if is_required:
-            lines.append(f"    {field_name}: {type_annotation}{type_ignore_comment}")
+            buf.write(f"    {field_name}: {type_annotation}{type_ignore_comment}\n")
         else:
-            lines.append(f"    {field_name}: {type_annotation} = None{type_ignore_comment}")
+            # The only place the optional `| None` suffix is added
+            buf.write(f"    {field_name}: {type_annotation} | None = None{type_ignore_comment}\n")
 
         has_fields = True
         processed_fields.add(field_name)
@@ -440,66 +513,67 @@ def _generate_class_stub(
         # Only add if not already processed (some are explicit in schema)
         if label_field not in processed_fields:
             # Add as optional string field
-            lines.append(f"    {label_field}: str | None = None")
+            buf.write(f"    {label_field}: str | None = None\n")
             has_fields = True
             processed_fields.add(label_field)
 
     # If no fields or enums, add pass
-    if not has_fields and not enums_to_generate:
-        lines.append("    pass")
+    if not has_fields and not has_enums:
+        buf.write("    pass\n")
 
-    return lines
+
+def _write_enum_stub(buf: io.StringIO, enum_name: str, enum_values: dict[str, Any]) -> None:
+    """Write a nested SiblingEnum class stub into buf."""
+    buf.write(f"    class {enum_name}(SiblingEnum):\n")
+
+    # Generate enum members with actual values, converting each key to int once
+    # and dropping non-dict entries before the sort rather than after it
+    enum_items = [
+        (int(value_key), value_data)
+        for value_key, value_data in enum_values.items()
+        if isinstance(value_data, dict)
+    ]
+    enum_items.sort(key=itemgetter(0))
+    for int_value, value_data in enum_items:
+        label = value_data.get("caption", str(int_value))
+        member_name = label_to_enum_name(label)
+        buf.write(f"        {member_name} = {int_value}\n")
+
+    # Add OTHER if not present
+    if "99" not in enum_values:
+        buf.write("        OTHER = 99\n")
+
+    buf.write("        @property\n")
+    buf.write("        def label(self) -> str: ...\n")
+    buf.write("        @classmethod\n")
+    buf.write("        def from_label(cls, label: str) -> Self: ...\n")
+    buf.write("\n")
 
 
 def _build_type_annotation(field_name: str, spec: dict[str, Any]) -> str:
-    """Build type annotation for a field."""
-    ocsf_type = spec.get("type", "string_t")
-    is_array = spec.get("is_array", False)
-    is_required = spec.get("requirement") == "required"
-
-    # Map OCSF types to Python types
-    # Includes both primitive types and constrained string types (email_t, url_t, etc.)
-    type_map = {
-        # Core primitives
-        "string_t": "str",
-        "integer_t": "int",
-        "long_t": "int",
-        "float_t": "float",
-        "boolean_t": "bool",
-        "timestamp_t": "int",
-        "datetime_t": "str",
-        "json_t": "dict[str, Any]",
-        "object_t": "dict[str, Any]",
-        # Constrained string types (all resolve to str in Python)
-        "email_t": "str",
-        "file_path_t": "str",
-        "file_name_t": "str",
-        "file_hash_t": "str",
-        "hostname_t": "str",
-        "ip_t": "str",
-        "mac_t": "str",
-        "subnet_t": "str",
-        "url_t": "str",
-        "uuid_t": "str",
-        "resource_uid_t": "str",
-        "process_name_t": "str",
-        "username_t": "str",
-        # Port is numeric
-        "port_t": "int",
-    }
+    """Build type annotation for a field, without the `| None` of optional fields."""
+    return _type_annotation(
+        spec.get("type", "string_t"),
+        bool(spec.get("is_array", False)),
+        spec.get("object_type"),
+    )
 
+
+@cache
+def _type_annotation(ocsf_type: str, is_array: bool, object_type: Optional[str]) -> str:
+    """Build a type annotation from the parts of a field spec that determine it."""
     # Check if it's an object reference
-    # Priority: explicit object_type > type field (if in type_map) > object reference
+    # Priority: explicit object_type > type field (if in OCSF_TYPE_MAP) > object reference
     needs_serialize_as_any = False
 
-    if "object_type" in spec:
-        python_type = snake_to_pascal(spec["object_type"])
+    if object_type is not None:
+        python_type = snake_to_pascal(object_type)
         # Check if it's the Object type which needs SerializeAsAny
-        needs_serialize_as_any = spec["object_type"] == "object"
-    elif ocsf_type in type_map:
-        python_type = type_map[ocsf_type]
+        needs_serialize_as_any = object_type == "object"
+    elif (mapped_type := OCSF_TYPE_MAP.get(ocsf_type)) is not None:
+        python_type = mapped_type
     else:
-        # Type is not in type_map, assume it's an object reference (e.g., "user", "process", "file")
+        # Not a known OCSF type, assume it's an object reference (e.g., "user", "process", "file")
         python_type = snake_to_pascal(ocsf_type)
         # Check if it's the Object type which needs SerializeAsAny
         needs_serialize_as_any = ocsf_type == "object"
@@ -512,13 +586,163 @@ def _build_type_annotation(field_name: str, spec: dict[str, Any]) -> str:
     if is_array:
         python_type = f"list[{python_type}]"
 
-    # Add None for optional fields
-    if not is_required:
-        python_type = f"{python_type} | None"
-
     return python_type
 
 
+def format_stub(content: str, path: Path) -> str:
+    """Format stub source in memory, as ruff format would for the file at path."""
+    ruff = shutil.which("ruff")
+    if ruff is None:
+        return content
+
+    formatted = subprocess.run(  # noqa: S603
+        [ruff, "format", "--quiet", "--stdin-filename", str(path), "-"],
+        input=content,
+        stdout=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        check=False,
+    )
+    # Keep the unformatted source if ruff could not process it
+    if formatted.returncode != 0:
+        return content
+    return formatted.stdout
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that content.
+
+    Returns:
+        True if the file was written
+    """
+    data = content.encode("utf-8")
+    if path.exists() and path.read_bytes() == data:
+        return False
+    # Write beside the target and rename, so an interrupted run never leaves a partial stub
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+# Rendered stubs per (schema, generator) so unchanged inputs skip regeneration
+STUB_CACHE_DIR = Path(__file__).parent.parent / ".stub_cache"
+STUB_FILES = ("objects.pyi", "events.pyi", "__init__.pyi")
+
+# Everything besides the schema that shapes the stub output (ruff reads pyproject.toml)
+GENERATOR_SOURCES = (
+    Path(__file__),
+    Path(__file__).parent.parent / "src" / "ocsf" / "_utils.py",
+    Path(__file__).parent.parent / "pyproject.toml",
+)
+
+
+def _ruff_version() -> str:
+    """Get the installed ruff version string, or "no-ruff" when ruff isn't on PATH."""
+    ruff = shutil.which("ruff")
+    if ruff is None:
+        return "no-ruff"
+    return subprocess.run(  # noqa: S603
+        [ruff, "--version"],
+        stdout=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        check=True,
+    ).stdout.strip()
+
+
+def _stub_cache_key(schema_bytes: bytes) -> str:
+    """Hash a schema together with the generator sources and formatter that render it."""
+    digest = hashlib.sha256(schema_bytes)
+    for source in GENERATOR_SOURCES:
+        if source.exists():
+            digest.update(source.read_bytes())
+    # Stubs are formatted only when ruff is available, and ruff releases change formatting
+    digest.update(_ruff_version().encode("utf-8"))
+    return digest.hexdigest()
+
+
+def process_version(schema_file: Path) -> tuple[str, str]:
+    """Generate the stubs for one schema file.
+
+    Stubs are restored from STUB_CACHE_DIR when the schema and the generator
+    are unchanged since they were last rendered.
+
+    Args:
+        schema_file: Path to a bundled schema (e.g., schemas/v1_7_0.json)
+
+    Returns:
+        Tuple of (captured progress output, name of the cache entry used)
+    """
+    version_str = schema_file.stem  # e.g., "v1_7_0"
+    version = version_str.lstrip("v").replace("_", ".")  # e.g., "1.7.0"
+
+    schema_bytes = schema_file.read_bytes()
+    cache_dir = STUB_CACHE_DIR / _stub_cache_key(schema_bytes)
+
+    # Generate stub files
+    stub_dir = schema_file.parent.parent / version_str.replace("-", "_")
+    stub_dir.mkdir(exist_ok=True)
+
+    # Capture progress output so the parent can print versions in order
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        print(f"\n{version_str} (OCSF v{version}):")
+
+        if cache_dir.is_dir():
+            for file_name in STUB_FILES:
+                content = (cache_dir / file_name).read_text(encoding="utf-8")
+                status = (
+                    "Restored" if _write_if_changed(stub_dir / file_name, content) else "Unchanged"
+                )
+                print(f"  {status} {file_name} from cache")
+            return log.getvalue(), cache_dir.name
+
+        # Load schema (json.loads detects the encoding from the raw bytes)
+        schema = json.loads(schema_bytes)
+
+        # Generate 3 files: objects.pyi, events.pyi, __init__.pyi
+        generate_objects_stub(version, schema, stub_dir)
+        generate_events_stub(version, schema, stub_dir)
+        generate_init_stub(version, schema, stub_dir)
+
+    # Fill a temporary directory and rename it, so a cache entry is never partial
+    tmp_dir = cache_dir.with_name(f"{cache_dir.name}.{os.getpid()}.tmp")
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    for file_name in STUB_FILES:
+        shutil.copyfile(stub_dir / file_name, tmp_dir / file_name)
+    try:
+        tmp_dir.replace(cache_dir)
+    except OSError:
+        # Another worker rendered an identical schema first
+        shutil.rmtree(tmp_dir)
+
+    return log.getvalue(), cache_dir.name
+
+
+def prune_stub_cache(keep: set[str]) -> int:
+    """Remove stub cache entries that the current run did not use.
+
+    Entries are keyed by schema, generator and ruff version, so every change to
+    one of those leaves the previous entry orphaned.
+
+    Args:
+        keep: Names of the cache entries used in this run
+
+    Returns:
+        Number of entries removed
+    """
+    if not STUB_CACHE_DIR.is_dir():
+        return 0
+
+    removed = 0
+    for entry in STUB_CACHE_DIR.iterdir():
+        if entry.name not in keep:
+            shutil.rmtree(entry, ignore_errors=True)
+            removed += 1
+    return removed
+
+
 def main() -> None:
     """Main entry point."""
     # Find schema files
@@ -532,25 +756,22 @@ def main() -> None:
     print("Regenerating type stubs...")
     print("=" * 70)
 
-    # Process each version
-    for schema_file in sorted(schema_dir.glob("v*.json")):
-        version_str = schema_file.stem  # e.g., "v1_7_0"
-        version = version_str.lstrip("v").replace("_", ".")  # e.g., "1.7.0"
-
-        # Load schema
-        with open(schema_file) as f:
-            schema = json.load(f)
-
-        # Generate stub files
-        stub_dir = schema_dir.parent / version_str.replace("-", "_")
-        stub_dir.mkdir(exist_ok=True)
-
-        print(f"\n{version_str} (OCSF v{version}):")
-
-        # Generate 3 files: objects.pyi, events.pyi, __init__.pyi
-        generate_objects_stub(version, schema, stub_dir)
-        generate_events_stub(version, schema, stub_dir)
-        generate_init_stub(version, schema, stub_dir)
+    if shutil.which("ruff") is None:
+        print("ruff not found, skipping stub formatting")
+
+    # Each version is independent, so generate them in parallel
+    schema_files = sorted(schema_dir.glob("v*.json"))
+    used_cache_entries: set[str] = set()
+    if schema_files:
+        max_workers = min(len(schema_files), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for log, cache_entry in executor.map(process_version, schema_files):
+                print(log, end="")
+                used_cache_entries.add(cache_entry)
+
+    pruned = prune_stub_cache(used_cache_entries)
+    if pruned:
+        print(f"\nPruned {pruned} stale stub cache entries")
 
     print("\n" + "=" * 70)
     print("✅ Stub generation complete!")
@@ -24,6 +24,7 @@ For detailed usage, see documentation at https://github.com/mcm/pydantic-ocsf
 
 from __future__ import annotations
 
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
 from ocsf._base import OCSFBaseModel as OCSFBaseModel
@@ -41,26 +42,33 @@ if TYPE_CHECKING:
 
 # Lazy import delegation to latest version (1.7.0)
 # This avoids importing everything at module load time
+_latest_module: ModuleType | None = None
 
 
 def __getattr__(name: str) -> Any:
-    """Lazy import symbols from the latest OCSF version."""
-    # Delegate to the latest version module
-    import importlib
+    """Lazy import symbols from the latest OCSF version.
 
-    # Handle namespace module access
-    if name in ("objects", "events"):
-        module = importlib.import_module("ocsf.v1_7_0")
-        return getattr(module, name)
+    Resolved symbols are stored in the module globals, so later lookups of the
+    same name are plain attribute access and never reach this hook again.
+    """
+    global _latest_module
 
-    # For backward compatibility during transition, allow direct imports
-    # but they must come from namespace modules
+    # Delegate to the latest version module, resolved once
+    if _latest_module is None:
+        import importlib
+
+        _latest_module = importlib.import_module("ocsf.v1_7_0")
+
+    # Namespace modules (objects, events) and, for backward compatibility during
+    # transition, direct imports - which must come from namespace modules
     try:
-        module = importlib.import_module("ocsf.v1_7_0")
-        return getattr(module, name)
+        value = getattr(_latest_module, name)
     except AttributeError:
         raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
+    globals()[name] = value
+    return value
+
 
 def __dir__() -> list[str]:
     """Support for dir() and autocomplete."""
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from ocsf._sibling_enum import SiblingEnum
+from ocsf._utils import label_to_enum_name
+
+# Created enum classes by (name, value/label pairs in order, parent class name).
+# The same enum recurs across schema versions and model rebuilds
+_enum_cache: dict[tuple[str, tuple[tuple[int, str], ...], str], type[SiblingEnum]] = {}
 
 
 def create_sibling_enum(
@@ -18,7 +24,7 @@ def create_sibling_enum(
         parent_class_name: Name of the parent model (e.g., "FileActivity")
 
     Returns:
-        Dynamically created SiblingEnum subclass
+        Dynamically created SiblingEnum subclass, shared by calls with equal arguments
 
     Example:
         ActivityId = create_sibling_enum(
@@ -33,30 +39,30 @@ def create_sibling_enum(
         ActivityId("Create")   # CREATE
         ActivityId.CREATE.label  # "Create"
     """
-    from ocsf._utils import label_to_enum_name
+    cache_key = (name, tuple(values.items()), parent_class_name)
+    cached = _enum_cache.get(cache_key)
+    if cached is not None:
+        return cached
 
-    # Create enum members
-    members = {}
-    for value, label in values.items():
-        # Convert label to valid enum member name (e.g., "Create" -> "CREATE")
-        member_name = label_to_enum_name(label)
-        members[member_name] = value
+    # Create enum members, converting labels to member names (e.g., "Create" -> "CREATE")
+    members = {label_to_enum_name(label): value for value, label in values.items()}
 
-    # Always include OTHER = 99 if not present
+    # Always include OTHER = 99 if not present (on a copy; the caller's mapping is left as is)
     if 99 not in values and "OTHER" not in members:
         members["OTHER"] = 99
-        values[99] = "Other"
+        values = {**values, 99: "Other"}
 
     # Create the enum class using functional API
     # mypy doesn't understand enum functional API, but it works at runtime
     enum_cls = SiblingEnum(name, members)  # type: ignore
 
-    # Inject the label map as a class method
-    enum_cls._get_label_map = classmethod(lambda cls: values)  # type: ignore
+    # Inject the label map as a class method, bound as a default rather than a closure cell
+    enum_cls._get_label_map = classmethod(lambda cls, _labels=values: _labels)  # type: ignore
 
     # Set module for better repr
     enum_cls.__module__ = f"ocsf.{parent_class_name.lower()}"
 
+    _enum_cache[cache_key] = enum_cls  # type: ignore
     return enum_cls  # type: ignore
 
 
@@ -87,29 +93,29 @@ def extract_inline_enums(
         if not isinstance(field_spec, dict):
             continue
 
-        # Merge with dictionary definition
-        if field_name in dict_attributes:
-            merged_spec = {**dict_attributes[field_name], **field_spec}
+        # Check if this field has an enum; its own definition wins over the
+        # dictionary's, as in a merge, but without building the merged dict.
+        # Without dictionary attributes only the field's own enum can apply
+        if "enum" in field_spec:
+            enum_def = field_spec["enum"]
+        elif dict_attributes and (dict_spec := dict_attributes.get(field_name)):
+            enum_def = dict_spec.get("enum")
         else:
-            merged_spec = field_spec
-
-        # Check if this field has an enum
-        enum_def = merged_spec.get("enum")
+            continue
         if not enum_def:
             continue
 
-        # Extract enum values
-        enum_values = {}
-        for value_key, value_data in enum_def.items():
-            try:
-                # value_key is like "1", "4", "99"
-                int_value = int(value_key)
-                # value_data has 'caption' for the label
-                label = value_data.get("caption", str(int_value))
-                enum_values[int_value] = label
-            except (ValueError, AttributeError):
-                # Skip invalid enum values
-                continue
+        # Extract enum values: value keys are like "1", "4", "99" and each value
+        # has a 'caption' for the label. Well-formed enums take one comprehension
+        try:
+            enum_values = {
+                (int_value := int(value_key)): _intern_label(
+                    value_data.get("caption", str(int_value))
+                )
+                for value_key, value_data in enum_def.items()
+            }
+        except (ValueError, AttributeError):
+            enum_values = _extract_valid_enum_values(enum_def)
 
         if enum_values:
             # Determine if this is a sibling ID field
@@ -118,3 +124,29 @@ def extract_inline_enums(
             inline_enums[field_name] = (enum_values, sibling_id)
 
     return inline_enums
+
+
+def _extract_valid_enum_values(enum_def: dict[str, Any]) -> dict[int, str]:
+    """Extract enum values one by one, skipping malformed entries.
+
+    Args:
+        enum_def: Schema enum definition mapping value keys to value data
+
+    Returns:
+        Mapping of int values to labels for the well-formed entries
+    """
+    enum_values: dict[int, str] = {}
+    for value_key, value_data in enum_def.items():
+        try:
+            int_value = int(value_key)
+            label = value_data.get("caption", str(int_value))
+            enum_values[int_value] = _intern_label(label)
+        except (ValueError, AttributeError):
+            # Skip invalid enum values
+            continue
+    return enum_values
+
+
+def _intern_label(label: Any) -> Any:
+    """Intern string labels; captions such as "Other" recur across most enums."""
+    return sys.intern(label) if type(label) is str else label
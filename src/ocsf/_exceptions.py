@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from difflib import get_close_matches
+
 
 class OCSFError(Exception):
     """Base exception for all OCSF errors."""
@@ -58,26 +60,36 @@ class ModelNotFoundError(OCSFError):
 
         return msg
 
-    def _find_similar_names(self) -> list[str]:
-        """Find similar model names using basic string matching."""
+    def _find_similar_names(self, limit: int = 5) -> list[str]:
+        """Find similar model names, best fuzzy matches first.
+
+        Close matches by similarity ratio come first; the remaining slots are filled
+        with substring and shared-prefix matches, stopping once ``limit`` is reached.
+        """
         if not self.available_models:
             return []
 
         search_lower = self.model_name.lower()
-        matches = []
-
-        for name in self.available_models:
-            name_lower = name.lower()
-            # Exact substring match
+        by_lower = {name.lower(): name for name in self.available_models}
+        matches = [
+            by_lower[name_lower]
+            for name_lower in get_close_matches(search_lower, by_lower, n=limit, cutoff=0.6)
+        ]
+
+        prefix = search_lower[:3] if len(search_lower) >= 3 else None
+        for name_lower, name in by_lower.items():
+            if len(matches) >= limit:
+                break
+            if name in matches:
+                continue
             if (
                 search_lower in name_lower
                 or name_lower in search_lower
-                or len(search_lower) >= 3
-                and name_lower.startswith(search_lower[:3])
+                or (prefix is not None and name_lower.startswith(prefix))
             ):
                 matches.append(name)
 
-        return matches[:5]  # Limit to top 5 suggestions
+        return matches
 
 
 class SchemaError(OCSFError):
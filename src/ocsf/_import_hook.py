@@ -3,6 +3,10 @@
 This module installs a Python import hook that intercepts imports of
 ocsf.v* modules and returns OCSFVersionModule instances that create
 models on-demand.
+
+The hook is a path entry finder bound to a sentinel entry on the ocsf
+package's __path__ (and on each version module's __path__), so Python only
+consults it while resolving ocsf submodules rather than for every import.
 """
 
 from __future__ import annotations
@@ -11,50 +15,55 @@ import importlib.abc
 import importlib.machinery
 import re
 import sys
-from collections.abc import Sequence
+from importlib import import_module
 from types import ModuleType
 
 from ocsf._exceptions import VersionNotFoundError
 from ocsf._schema_loader import get_schema_loader
 
+# Version module names, e.g. "v1_7_0" or "v1_8_0_dev"
+_VERSION_RE = re.compile(r"v(\d+)_(\d+)_(\d+)(_dev)?$")
+
+# Sentinel __path__ entry that routes submodule lookups to the OCSF importer
+JIT_PATH_ENTRY = "<ocsf-jit>"
 
-class OCSFImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+
+class OCSFImporter(importlib.abc.PathEntryFinder, importlib.abc.Loader):
     """Import hook for OCSF JIT modules.
 
     Intercepts imports of:
-    - ocsf (root package)
     - ocsf.v1_7_0 (version module)
+    - ocsf.v1_7_0.objects, ocsf.v1_7_0.events (namespace modules)
     """
 
     def find_spec(
         self,
         fullname: str,
-        path: Sequence[str] | None,
         target: ModuleType | None = None,
     ) -> importlib.machinery.ModuleSpec | None:
         """Check if this is an OCSF module we should handle.
 
         Args:
             fullname: Full module name (e.g., "ocsf.v1_7_0", "ocsf.v1_7_0.objects")
-            path: Parent module's __path__ attribute
             target: Target module (unused)
 
         Returns:
             ModuleSpec if we should handle this import, None otherwise
         """
-        parts = fullname.split(".")
-
-        # Handle: ocsf, ocsf.v1_7_0, ocsf.v1_7_0.objects, etc.
-        if len(parts) >= 1 and parts[0] == "ocsf":
-            if len(parts) == 1:
-                # Just 'ocsf' - let normal import handle it
-                return None
-            elif len(parts) == 2 and parts[1].startswith("v"):
-                # ocsf.v1_7_0 - mark as package (has submodules)
-                return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
-            elif len(parts) == 3 and parts[1].startswith("v") and parts[2] in ("objects", "events"):
-                # ocsf.v1_7_0.objects or ocsf.v1_7_0.events
-                return importlib.machinery.ModuleSpec(fullname, self, is_package=False)
+        # Only reached for submodules of ocsf packages, but stay strict about it
+        if not fullname.startswith("ocsf."):
+            return None
+
+        # At most ocsf.<version>.<namespace> is ours, so never split further than that
+        parts = fullname.split(".", 3)
+
+        # Handle: ocsf.v1_7_0, ocsf.v1_7_0.objects, etc.
+        if len(parts) == 2 and parts[1].startswith("v"):
+            # ocsf.v1_7_0 - mark as package (has submodules)
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        elif len(parts) == 3 and parts[1].startswith("v") and parts[2] in ("objects", "events"):
+            # ocsf.v1_7_0.objects or ocsf.v1_7_0.events
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=False)
 
         return None
 
@@ -79,19 +88,19 @@ class OCSFImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
         if len(parts) == 2:
             # ocsf.v1_7_0
             version_name = parts[1]
-            m = re.match(r"v(\d+)_(\d+)_(\d+)", version_name)
+            m = _VERSION_RE.match(version_name)
             if not m:
                 raise ImportError(f"Invalid OCSF version format: {version_name}")
 
-            version = ".".join(m.groups())
-            if version_name.endswith("_dev"):
+            major, minor, patch, dev = m.groups()
+            version = f"{major}.{minor}.{patch}"
+            if dev:
                 version = f"{version}-dev"
 
             # Check if version exists
             loader = get_schema_loader()
-            available = loader.get_available_versions()
-            if version not in available:
-                raise VersionNotFoundError(version, available)
+            if not loader.has_version(version):
+                raise VersionNotFoundError(version, loader.get_available_versions())
 
             # Create version module
             module = OCSFVersionModule(fullname, version)
@@ -102,19 +111,11 @@ class OCSFImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
             parent_name = ".".join(parts[:2])
             namespace_type = parts[2]
 
-            # Ensure parent module is loaded first
-            if parent_name not in sys.modules:
-                # Trigger parent import
-                parent_spec = self.find_spec(parent_name, None, None)
-                if parent_spec and parent_spec.loader:
-                    parent_module = parent_spec.loader.create_module(parent_spec)
-                    if parent_module:
-                        sys.modules[parent_name] = parent_module
-                        parent_spec.loader.exec_module(parent_module)
-
+            # The import system always imports the parent package first; a spec
+            # loaded by hand still gets its parent through the regular machinery
             parent_module = sys.modules.get(parent_name)
             if parent_module is None:
-                raise ImportError(f"Cannot import {fullname}: parent module not found")
+                parent_module = import_module(parent_name)
 
             # Type assertion: we know parent_module is OCSFVersionModule
             if not isinstance(parent_module, OCSFVersionModule):
@@ -137,16 +138,50 @@ class OCSFImporter(importlib.abc.MetaPathFinder, importlib.abc.Loader):
         sys.modules[module.__name__] = module
 
 
+_importer = OCSFImporter()
+
+
+def _path_hook(entry: str) -> OCSFImporter:
+    """Return the OCSF importer for the sentinel path entry only.
+
+    Args:
+        entry: A path entry being resolved by the import system
+
+    Returns:
+        The shared OCSFImporter instance
+
+    Raises:
+        ImportError: For any other path entry, so the next hook is tried
+    """
+    if entry != JIT_PATH_ENTRY:
+        raise ImportError("not an OCSF JIT path entry")
+    return _importer
+
+
 def install_hook() -> None:
     """Install the OCSF import hook.
 
     This should be called once when the ocsf package is imported.
     It's safe to call multiple times (idempotent).
     """
-    # Check if already installed
-    for finder in sys.meta_path:
-        if isinstance(finder, OCSFImporter):
-            return
-
-    # Install at the beginning of meta_path
-    sys.meta_path.insert(0, OCSFImporter())
+    # The hook also rebuilds the finder if importlib.invalidate_caches() drops it.
+    # Match by name so a reloaded module replaces its stale hook instead of adding one
+    installed = [
+        hook
+        for hook in sys.path_hooks
+        if getattr(hook, "__module__", None) == __name__
+        and getattr(hook, "__name__", None) == _path_hook.__name__
+    ]
+    if installed != [_path_hook]:
+        for hook in installed:
+            sys.path_hooks.remove(hook)
+        sys.path_hooks.insert(0, _path_hook)
+        sys.path_importer_cache.pop(JIT_PATH_ENTRY, None)
+
+    # Put the sentinel ahead of the real directory: ocsf.v* imports are answered
+    # without a filesystem probe, and every other submodule is declined at once
+    package_path = sys.modules["ocsf"].__path__
+    if not package_path or package_path[0] != JIT_PATH_ENTRY:
+        if JIT_PATH_ENTRY in package_path:
+            package_path.remove(JIT_PATH_ENTRY)
+        package_path.insert(0, JIT_PATH_ENTRY)
@@ -2,12 +2,37 @@
 
 from __future__ import annotations
 
-from typing import Any
+import sys
+from functools import cached_property
+from itertools import chain
+from typing import Any, Optional
 
 from pydantic import Field, create_model
 
 from ocsf._base import OCSFBaseModel
+from ocsf._enum_factory import create_sibling_enum, extract_inline_enums
 from ocsf._exceptions import ModelNotFoundError
+from ocsf._normalizer import create_normalizer
+from ocsf._sibling_validator import create_sibling_reconciler
+from ocsf._uid_validator import create_uid_prefill_validator
+from ocsf._utils import (
+    _RESERVED_KEYWORDS_LOWER,
+    extract_observable_type_ids,
+    infer_sibling_label_field,
+    ocsf_type_to_python,
+    pascal_to_snake,
+    snake_to_pascal,
+)
+
+# Runtime types for the annotation strings ocsf_type_to_python returns for non-model types
+_PRIMITIVE_TYPES: dict[str, Any] = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "dict[str, Any]": dict[str, Any],
+    "Any": Any,
+}
 
 
 class ModelFactory:
@@ -30,6 +55,20 @@ class ModelFactory:
         self.events = schema.get("events", {})
         self.dictionary = schema.get("dictionary", {})
         self.dict_attributes = self.dictionary.get("attributes", {})
+        # Models already built, by (name, namespace_filter)
+        self._created: dict[tuple[str, str | None], type[OCSFBaseModel]] = {}
+
+    @cached_property
+    def _category_map(self) -> dict[str, int]:
+        """Category name -> UID mapping from categories_meta."""
+        categories_meta = self.schema.get("categories_meta", {})
+        category_attrs = categories_meta.get("attributes", {})
+        return {name: info["uid"] for name, info in category_attrs.items()}
+
+    @cached_property
+    def _available_models(self) -> list[str]:
+        """PascalCase names of all objects and events, computed once."""
+        return [snake_to_pascal(k) for k in chain(self.objects, self.events)]
 
     def create_model(
         self,
@@ -49,32 +88,40 @@ class ModelFactory:
 
         Raises:
             ModelNotFoundError: If the model name is not found in the schema
+
+        Note:
+            Each (name, namespace_filter) pair is built once per factory; later calls
+            return the same class even with a different ``model_cache``.
         """
-        from ocsf._utils import snake_to_pascal
+        created_key = (name, namespace_filter)
+        if created_key in self._created:
+            return self._created[created_key]
 
         # Convert PascalCase name to snake_case for schema lookup
         # Try both the provided name and snake_case version
         schema_name = self._pascal_to_snake(name)
 
-        # Apply namespace filter
+        # Apply namespace filter, noting whether the spec is an event's
+        is_event = namespace_filter == "events"
         if namespace_filter == "objects":
             spec = self.objects.get(schema_name) or self.objects.get(name)
-        elif namespace_filter == "events":
+        elif is_event:
             spec = self.events.get(schema_name) or self.events.get(name)
         else:
             # No filter - search both (backward compatibility)
-            spec = (
-                self.objects.get(schema_name)
-                or self.events.get(schema_name)
-                or self.objects.get(name)
-                or self.events.get(name)
-            )
+            for namespace, key in (
+                (self.objects, schema_name),
+                (self.events, schema_name),
+                (self.objects, name),
+                (self.events, name),
+            ):
+                spec = namespace.get(key)
+                if spec:
+                    break
+            is_event = spec is not None and namespace is self.events
 
         if spec is None:
-            # Convert all schema names to PascalCase for error message
-            available = [
-                snake_to_pascal(k) for k in list(self.objects.keys()) + list(self.events.keys())
-            ]
+            available = self._available_models
             if namespace_filter:
                 raise ModelNotFoundError(
                     f"{name} (in {namespace_filter} namespace)", self.version, available
@@ -101,16 +148,12 @@ class ModelFactory:
             base_class = model_cache[parent_cache_key]
 
         # Phase 2: Extract inline enums
-        from ocsf._enum_factory import create_sibling_enum, extract_inline_enums
-
         attributes = spec.get("attributes", {})
         inline_enums = extract_inline_enums(attributes, self.dictionary)
 
         # Special case: Observable.TypeId is a derived enum
         # Its values are collected from all "observable" field definitions across the schema
         if name == "Observable" and "type_id" in attributes:
-            from ocsf._utils import extract_observable_type_ids
-
             # Extract all observable type_id values from the entire schema
             observable_types = extract_observable_type_ids(self.schema)
             # Override the inline enum for type_id with the derived values
@@ -126,33 +169,26 @@ class ModelFactory:
                 enum_classes[field_name] = enum_cls
 
         # Phase 3: Build field definitions
-        field_defs = {}
+        field_defs: dict[str, tuple[Any, Any]] = {}
 
         for schema_field_name, field_spec in attributes.items():
-            # Skip special schema directives like $include
-            if schema_field_name.startswith("$"):
-                continue
-
-            # Skip non-dict field specs (shouldn't happen but be safe)
-            if not isinstance(field_spec, dict):
+            # Skip non-dict field specs (shouldn't happen but be safe) and
+            # special schema directives like $include
+            if not isinstance(field_spec, dict) or schema_field_name.startswith("$"):
                 continue
 
             # Convert reserved keywords to have trailing underscore
             field_name, field_alias = self._handle_reserved_keyword(schema_field_name)
+            is_required = field_spec.get("requirement") == "required"
 
             # Check if this field has an inline enum
-            if schema_field_name in enum_classes:
-                # Use the enum type
-                enum_cls = enum_classes[schema_field_name]
-                is_required = field_spec.get("requirement") == "required"
-
+            field_enum = enum_classes.get(schema_field_name)
+            if field_enum is not None:
                 # Build type annotation with enum
-                field_type_annotation = enum_cls if is_required else f"{enum_cls.__name__} | None"
+                field_type_annotation = field_enum if is_required else Optional[field_enum]
             else:
                 field_type_annotation = self._build_field_type(schema_field_name, field_spec)
 
-            is_required = field_spec.get("requirement") == "required"
-
             # type_uid is always auto-calculated by the UID prefill validator
             # (type_uid = class_uid * 100 + activity_id), so it must never be
             # a required field even though the OCSF schema marks it as such.
@@ -160,33 +196,22 @@ class ModelFactory:
             # using the schema's requirement (required → no | None suffix).
             if schema_field_name == "type_uid":
                 is_required = False
-                if not isinstance(field_type_annotation, str) or not field_type_annotation.endswith(
-                    "| None"
-                ):
+                if not isinstance(field_type_annotation, str):
+                    # Optional[] of an already optional type is a no-op
+                    field_type_annotation = Optional[field_type_annotation]
+                elif not field_type_annotation.endswith("| None"):
                     field_type_annotation = f"{field_type_annotation} | None"
 
-            # Create field with appropriate default and alias
-            if is_required:
-                if field_alias:
-                    field_defs[field_name] = (field_type_annotation, Field(..., alias=field_alias))
-                else:
-                    field_defs[field_name] = (field_type_annotation, Field(...))
-            else:
-                if field_alias:
-                    field_defs[field_name] = (
-                        field_type_annotation,
-                        Field(default=None, alias=field_alias),
-                    )
-                else:
-                    field_defs[field_name] = (
-                        field_type_annotation,
-                        Field(default=None),
-                    )
+            # Create field with appropriate default and alias (omitted, not None, when unused)
+            default: Any = ... if is_required else None
+            field_kwargs: dict[str, Any] = {"alias": field_alias} if field_alias else {}
+            field_defs[field_name] = (field_type_annotation, Field(default, **field_kwargs))
 
         # Phase 3b: Infer sibling label fields for enum-backed ID fields
         # Per OCSF spec, sibling attributes may be explicitly in the schema or
-        # defined in the dictionary's 'sibling' attribute, or must be inferred
-        from ocsf._utils import infer_sibling_label_field
+        # defined in the dictionary's 'sibling' attribute, or must be inferred.
+        # Resolved once here: ID field -> (Python label field, label alias)
+        sibling_labels: dict[str, tuple[str, str | None]] = {}
 
         for field_name in enum_classes:
             if field_name.endswith("_id"):
@@ -202,13 +227,14 @@ class ModelFactory:
                     # Fall back to inference if no explicit sibling
                     label_field = infer_sibling_label_field(field_name)
                     label_alias = None
+                sibling_labels[field_name] = (label_field, label_alias)
 
                 # Only add if not already defined (some are explicit in schema)
                 if label_field not in field_defs:
                     # Add as optional string field with alias if needed
                     if label_alias:
                         field_defs[label_field] = (
-                            "str | None",
+                            Optional[str],
                             Field(
                                 default=None,
                                 alias=label_alias,
@@ -217,7 +243,7 @@ class ModelFactory:
                         )
                     else:
                         field_defs[label_field] = (
-                            "str | None",
+                            Optional[str],
                             Field(default=None, description=f"Label for {field_name}"),
                         )
 
@@ -225,48 +251,23 @@ class ModelFactory:
         validators_dict = {}
 
         # Phase 4a: Create and add normalizer FIRST (MUST run before reconcilers)
-        from ocsf._normalizer import create_normalizer
-
         validators_dict["_normalize_field_names_to_aliases"] = create_normalizer()
 
         # Phase 4b: Add sibling reconciliation validators
-        from ocsf._sibling_validator import create_sibling_reconciler
-        from ocsf._utils import infer_sibling_label_field
-
-        for field_name in enum_classes:
-            if field_name.endswith("_id"):
-                # Use the same logic as Phase 3b to determine the label field
-                dict_def = self.dict_attributes.get(field_name, {})
-                explicit_sibling = dict_def.get("sibling")
-
-                if explicit_sibling:
-                    # Use the explicit sibling name from the dictionary
-                    label_field, label_alias = self._handle_reserved_keyword(explicit_sibling)
-                    # For the reconciler (mode='before' validator), use the OCSF field name
-                    # (alias) if present, since it operates on raw input data
-                    reconciler_label_field = label_alias if label_alias else label_field
-                else:
-                    # Fall back to inference
-                    label_field = infer_sibling_label_field(field_name)
-                    reconciler_label_field = label_field
-
-                # Check if label field exists in our field definitions
-                # (either from schema or inferred in Phase 3b)
-                if label_field in field_defs:
-                    enum_cls = enum_classes[field_name]
-                    # Pass the OCSF field name to the reconciler (not Python field name)
-                    reconciler = create_sibling_reconciler(
-                        field_name, reconciler_label_field, enum_cls
-                    )
-                    validator_name = f"_reconcile_{field_name}"
-                    validators_dict[validator_name] = reconciler
+        for field_name, (label_field, label_alias) in sibling_labels.items():
+            # Check if label field exists in our field definitions
+            # (either from schema or inferred in Phase 3b)
+            if label_field in field_defs:
+                # For the reconciler (mode='before' validator), use the OCSF field name
+                # (alias) if present, since it operates on raw input data
+                reconciler_label_field = label_alias if label_alias else label_field
+                reconciler = create_sibling_reconciler(
+                    field_name, reconciler_label_field, enum_classes[field_name]
+                )
+                validators_dict[f"_reconcile_{field_name}"] = reconciler
 
         # Phase 4c: Add UID pre-fill validator for events only
-        if namespace_filter == "events" or (
-            namespace_filter is None and schema_name in self.events
-        ):
-            from ocsf._uid_validator import create_uid_prefill_validator
-
+        if is_event:
             # Resolve category_uid by tracing inheritance
             category_uid = self._resolve_category_uid(spec)
 
@@ -292,6 +293,7 @@ class ModelFactory:
             # Attach with the PascalCase name (e.g., ActivityId)
             setattr(model, enum_cls.__name__, enum_cls)
 
+        self._created[created_key] = model
         return model  # type: ignore[no-any-return]
 
     def _build_field_type(self, field_name: str, field_spec: dict[str, Any]) -> Any:
@@ -304,21 +306,15 @@ class ModelFactory:
         Returns:
             Python type annotation (may include forward references as strings)
         """
-        from pydantic import SerializeAsAny  # noqa: F401 - Used in string annotations
-
-        from ocsf._utils import ocsf_type_to_python, snake_to_pascal
-
         # Merge with dictionary definition if field spec is minimal
-        if field_name in self.dict_attributes:
-            dict_def = self.dict_attributes[field_name]
-            # Merge: local spec overrides dictionary
-            merged_spec = {**dict_def, **field_spec}
-        else:
-            merged_spec = field_spec
+        dict_def = self.dict_attributes.get(field_name)
+        # Merge: local spec overrides dictionary
+        merged_spec = {**dict_def, **field_spec} if dict_def else field_spec
 
         ocsf_type = merged_spec.get("type", "string_t")
         is_array = merged_spec.get("is_array", False)
         is_required = merged_spec.get("requirement") == "required"
+        object_type = merged_spec.get("object_type")
         needs_serialize_as_any = False
 
         # Check if type references an object (OCSF uses object names as types)
@@ -328,22 +324,22 @@ class ModelFactory:
             # Check if it's the Object type which needs SerializeAsAny
             needs_serialize_as_any = ocsf_type == "object"
         # Handle explicit object_type field
-        elif "object_type" in merged_spec:
-            python_type = snake_to_pascal(merged_spec["object_type"])
+        elif object_type is not None:
+            python_type = snake_to_pascal(object_type)
             # Check if it's the Object type which needs SerializeAsAny
-            needs_serialize_as_any = merged_spec["object_type"] == "object"
-        # Handle enum types
-        elif "enum" in merged_spec:
-            # For now, treat as int (Phase 2 will add enum support)
-            python_type = "int"
-        # Map primitive types
+            needs_serialize_as_any = object_type == "object"
         else:
-            python_type = ocsf_type_to_python(
-                ocsf_type,
-                is_array=False,
-                object_type=None,
-                enum_name=None,
-            )
+            # Not a model reference: use the real type, so Pydantic has no
+            # forward reference to resolve for this field
+            if merged_spec.get("enum") is not None:
+                # Handle enum types: treat as int (Phase 2 will add enum support)
+                field_type: Any = int
+            else:
+                # Map primitive types
+                field_type = _PRIMITIVE_TYPES[ocsf_type_to_python(ocsf_type)]
+            if is_array:
+                field_type = list[field_type]
+            return field_type if is_required else Optional[field_type]
 
         # Wrap Object type with SerializeAsAny for proper serialization
         if needs_serialize_as_any:
@@ -356,7 +352,8 @@ class ModelFactory:
         if not is_required:
             type_annotation = f"{type_annotation} | None"
 
-        return type_annotation
+        # Model references such as "User | None" repeat across many fields and models
+        return sys.intern(type_annotation)
 
     def _pascal_to_snake(self, name: str) -> str:
         """Convert PascalCase to snake_case.
@@ -371,13 +368,7 @@ class ModelFactory:
             OCSF uses leading underscores for some base classes like _entity, _dns.
             We need to check both with and without leading underscore.
         """
-        import re
-
-        # Insert underscores before uppercase letters that follow lowercase letters
-        s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-        # Insert underscores before uppercase letters that follow lowercase or uppercase letters
-        s2 = re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1)
-        snake_name = s2.lower()
+        snake_name = pascal_to_snake(name)
 
         # Check if the schema has this with a leading underscore
         # (OCSF uses _entity, _dns, _resource for base classes)
@@ -395,15 +386,10 @@ class ModelFactory:
         Returns:
             Category UID (1-8) or None if not found/not applicable
         """
-        # Build category name -> UID mapping from categories_meta
-        categories_meta = self.schema.get("categories_meta", {})
-        category_attrs = categories_meta.get("attributes", {})
-        category_map = {name: info["uid"] for name, info in category_attrs.items()}
-
         # Check if this event has a category field
         if "category" in spec and spec["category"]:
             category_name = spec["category"]
-            return category_map.get(category_name)
+            return self._category_map.get(category_name)
 
         # Trace through inheritance chain to find category
         if "extends" in spec:
@@ -429,50 +415,8 @@ class ModelFactory:
             - python_field_name: Field name to use in Python (e.g., "type_", "class_", "normal_field")
             - alias: Original name to use for serialization (e.g., "type", "class") or None
         """
-        # Python reserved keywords that need underscore suffix
-        RESERVED_KEYWORDS = {
-            "False",
-            "None",
-            "True",
-            "and",
-            "as",
-            "assert",
-            "async",
-            "await",
-            "break",
-            "class",
-            "continue",
-            "def",
-            "del",
-            "elif",
-            "else",
-            "except",
-            "finally",
-            "for",
-            "from",
-            "global",
-            "if",
-            "import",
-            "in",
-            "is",
-            "lambda",
-            "nonlocal",
-            "not",
-            "or",
-            "pass",
-            "raise",
-            "return",
-            "try",
-            "while",
-            "with",
-            "yield",
-            "type",
-        }
-
         # Check if field name is a reserved keyword
-        if field_name in RESERVED_KEYWORDS or field_name.lower() in {
-            k.lower() for k in RESERVED_KEYWORDS
-        }:
+        if field_name.lower() in _RESERVED_KEYWORDS_LOWER:
             # Return field name with underscore and original name as alias
             return (f"{field_name}_", field_name)
 
@@ -485,6 +429,4 @@ class ModelFactory:
         Returns:
             List of model names (both objects and events) in PascalCase
         """
-        from ocsf._utils import snake_to_pascal
-
-        return [snake_to_pascal(k) for k in list(self.objects.keys()) + list(self.events.keys())]
+        return list(self._available_models)
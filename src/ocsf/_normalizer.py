@@ -6,6 +6,49 @@ from typing import Any
 
 from pydantic import model_validator
 
+# Class attribute holding each model's Python field name -> alias map, built on first use
+_FIELD_ALIASES_ATTR = "__ocsf_field_aliases__"
+
+
+def _field_aliases(cls: type[Any]) -> dict[str, str]:
+    """Return the Python field name -> alias map for a model class.
+
+    The map is computed from ``model_fields`` on first use and stored on the class
+    itself. It is read from the class ``__dict__`` so that subclasses, which may
+    add their own aliased fields, build their own map instead of inheriting one.
+    """
+    field_to_alias: dict[str, str] | None = cls.__dict__.get(_FIELD_ALIASES_ATTR)
+    if field_to_alias is None:
+        # Only map if they have an alias and are different (e.g., "type_" -> "type", not "name" -> "name")
+        field_to_alias = {
+            field_name: field_info.validation_alias
+            for field_name, field_info in cls.model_fields.items()
+            if isinstance(field_info.validation_alias, str)
+            and field_info.validation_alias
+            and field_name != field_info.validation_alias
+        }
+        setattr(cls, _FIELD_ALIASES_ATTR, field_to_alias)
+    return field_to_alias
+
+
+def _normalize_field_names(cls: type[Any], data: Any) -> Any:
+    """Normalize Python field names with aliases to use the alias consistently."""
+    if not isinstance(data, dict):
+        return data
+
+    field_to_alias = _field_aliases(cls)
+
+    # If there are no fields with aliases, return data as-is
+    if not field_to_alias:
+        return data
+
+    # Most payloads already use the aliases, so skip the rebuild when nothing needs renaming
+    if field_to_alias.keys().isdisjoint(data):
+        return data
+
+    # Convert Python field names to their aliases
+    return {field_to_alias.get(key, key): value for key, value in data.items()}
+
 
 def create_normalizer() -> Any:
     """Create a validator that normalizes Python field names to OCSF aliases.
@@ -15,6 +58,9 @@ def create_normalizer() -> Any:
     duplicate keys in the data dict and ensures proper interaction with sibling
     reconciliation validators.
 
+    Every model shares the same normalization function; the per-model alias map is
+    built once per class rather than on every validation.
+
     Returns:
         Pydantic model_validator that normalizes field names
 
@@ -22,39 +68,4 @@ def create_normalizer() -> Any:
         Input:  {"type_": "Risk", "type_id": 99}
         Output: {"type": "Risk", "type_id": 99}
     """
-
-    @model_validator(mode="before")  # type: ignore[misc]
-    @classmethod
-    def normalize(cls: type[Any], data: Any) -> Any:
-        """Normalize Python field names with aliases to use the alias consistently."""
-        if not isinstance(data, dict):
-            return data
-
-        # Build mapping: Python field name -> alias (for fields that have aliases)
-        field_to_alias = {}
-        for field_name, field_info in cls.model_fields.items():
-            # Only map if they have an alias and are different (e.g., "type_" -> "type", not "name" -> "name")
-            if (
-                field_info.validation_alias
-                and isinstance(field_info.validation_alias, str)
-                and field_name != field_info.validation_alias
-            ):
-                field_to_alias[field_name] = field_info.validation_alias
-
-        # If there are no fields with aliases, return data as-is
-        if not field_to_alias:
-            return data
-
-        # Convert Python field names to their aliases
-        normalized = {}
-        for key, value in data.items():
-            if key in field_to_alias:
-                # Use alias instead of Python field name
-                alias_key = field_to_alias[key]
-                normalized[alias_key] = value
-            else:
-                normalized[key] = value
-
-        return normalized
-
-    return normalize
+    return model_validator(mode="before")(classmethod(_normalize_field_names))  # type: ignore
@@ -15,6 +15,9 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
+# Class attribute holding each enum's lowercased label -> value map, built on first use
+_LABEL_LOOKUP_ATTR = "__ocsf_label_lookup__"
+
 
 class SiblingEnum(IntEnum):
     """Base class for OCSF sibling enums with string label support.
@@ -62,6 +65,24 @@ class SiblingEnum(IntEnum):
         """
         return {}
 
+    @classmethod
+    def _get_label_lookup(cls) -> dict[str, int]:
+        """Get the mapping of lowercased labels to enum values.
+
+        The lookup is built from `_get_label_map()` on first use and stored on the
+        class itself. When two labels differ only in case, the first one wins.
+
+        Returns:
+            Dictionary mapping lowercased labels to integer enum values
+        """
+        lookup: dict[str, int] | None = cls.__dict__.get(_LABEL_LOOKUP_ATTR)
+        if lookup is None:
+            lookup = {}
+            for value, lbl in cls._get_label_map().items():
+                lookup.setdefault(lbl.lower(), value)
+            setattr(cls, _LABEL_LOOKUP_ATTR, lookup)
+        return lookup
+
     @property
     def label(self) -> str:
         """Return the canonical human-readable label for this value.
@@ -98,11 +119,9 @@ class SiblingEnum(IntEnum):
             >>> ActivityId.from_label("create")
             <ActivityId.CREATE: 1>
         """
-        normalized = label.lower()
-        label_map = cls._get_label_map()
-        for value, lbl in label_map.items():
-            if lbl.lower() == normalized:
-                return cls(value)
+        value = cls._get_label_lookup().get(label.lower())
+        if value is not None:
+            return cls(value)
         raise ValueError(f"Unknown {cls.__name__} label: {label!r}")
 
     @classmethod
@@ -126,11 +145,14 @@ class SiblingEnum(IntEnum):
             ValueError: If the value is a string that doesn't match any label,
                        or if the value is not a valid integer or string
         """
-        if isinstance(value, str):
-            # Try case-insensitive label lookup
-            return cls.from_label(value)  # Raises ValueError if not found
-        # Not a string and not a valid member - let the standard error occur
-        raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+        if not isinstance(value, str):
+            # Not a string and not a valid member (e.g. an unknown ID) - let the standard error occur
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+        # Case-insensitive label lookup, as in from_label but without the extra call
+        member_value = cls._get_label_lookup().get(value.lower())
+        if member_value is None:
+            raise ValueError(f"Unknown {cls.__name__} label: {value!r}")
+        return cls(member_value)
 
     def __new__(cls, value: int | str) -> Self:
         """Create enum member from integer or string value.
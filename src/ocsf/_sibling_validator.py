@@ -43,6 +43,10 @@ def create_sibling_reconciler(
                 "activity_id", "activity_name", ActivityId
             )
     """
+    label_map = enum_class._get_label_map()
+    lower_labels = {value: label.lower() for value, label in label_map.items()}
+    # Python field name for the label (e.g., "type_" if label_field is "type")
+    python_field_name = label_field + "_"
 
     @model_validator(mode="before")  # type: ignore[misc]
     @classmethod
@@ -54,14 +58,19 @@ def create_sibling_reconciler(
         id_value = data.get(id_field)
         label_value = data.get(label_field)
 
-        # Also check for Python field name (e.g., "type_" if label_field is "type")
+        # Fast path: the ID and its canonical label are both present and already agree
+        if (
+            type(id_value) is int
+            and label_value is not None
+            and label_map.get(id_value) == label_value
+        ):
+            return data
+
+        # Also check for the Python field name
         # This handles the case where user provides type_="value" before normalization
-        python_field_name = label_field + "_"
         if label_value is None and python_field_name in data:
-            label_value = data.get(python_field_name)
             # Normalize: move the value from python_field_name to label_field
-            data[label_field] = label_value
-            del data[python_field_name]
+            label_value = data[label_field] = data.pop(python_field_name)
 
         # Case 1 & 6: Both present or both absent - validate consistency
         if id_value is not None and label_value is not None:
@@ -77,8 +86,10 @@ def create_sibling_reconciler(
                 return data
 
             expected_label = enum_member.label
-            # Validate consistency (case-insensitive)
-            if label_value != expected_label and label_value.lower() != expected_label.lower():
+            # Validate consistency (case-insensitive); labels missing from the map fall back to
+            # the stringified ID, which is already lowercase
+            expected_lower = lower_labels.get(enum_member.value, expected_label)
+            if label_value != expected_label and label_value.lower() != expected_lower:
                 raise ValueError(
                     f"Inconsistent {id_field}={id_value} and "
                     f"{label_field}={label_value!r} "
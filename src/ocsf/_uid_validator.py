@@ -41,44 +41,42 @@ def create_uid_prefill_validator(
 
         # category_uid: fixed constant for this event type
         if category_uid is not None:
-            if "category_uid" in data and data["category_uid"] is not None:
-                if data["category_uid"] != category_uid:
-                    raise ValueError(
-                        f"category_uid must be {category_uid} for this event type, "
-                        f"got {data['category_uid']!r}"
-                    )
-            else:
+            provided = data.get("category_uid")
+            if provided is None:
                 data["category_uid"] = category_uid
+            elif provided != category_uid:
+                raise ValueError(
+                    f"category_uid must be {category_uid} for this event type, got {provided!r}"
+                )
 
         # class_uid: fixed constant for this event type
         if class_uid is not None:
-            if "class_uid" in data and data["class_uid"] is not None:
-                if data["class_uid"] != class_uid:
-                    raise ValueError(
-                        f"class_uid must be {class_uid} for this event type, "
-                        f"got {data['class_uid']!r}"
-                    )
-            else:
+            provided = data.get("class_uid")
+            if provided is None:
                 data["class_uid"] = class_uid
+            elif provided != class_uid:
+                raise ValueError(
+                    f"class_uid must be {class_uid} for this event type, got {provided!r}"
+                )
 
         # type_uid: calculated as class_uid * 100 + activity_id
         cls_uid = data.get("class_uid", class_uid)
         activity_id = data.get("activity_id")
 
         if cls_uid is not None and activity_id is not None:
-            if hasattr(activity_id, "value"):
-                activity_id = activity_id.value
-            expected_type_uid = cls_uid * 100 + int(activity_id)
-
-            if "type_uid" in data and data["type_uid"] is not None:
-                if data["type_uid"] != expected_type_uid:
-                    raise ValueError(
-                        f"type_uid must be {expected_type_uid} "
-                        f"(class_uid={cls_uid} * 100 + activity_id={activity_id}), "
-                        f"got {data['type_uid']!r}"
-                    )
-            else:
+            # int() unwraps enum members (SiblingEnum is an IntEnum) as well as plain IDs
+            activity_value = int(activity_id)
+            expected_type_uid = cls_uid * 100 + activity_value
+
+            provided = data.get("type_uid")
+            if provided is None:
                 data["type_uid"] = expected_type_uid
+            elif provided != expected_type_uid:
+                raise ValueError(
+                    f"type_uid must be {expected_type_uid} "
+                    f"(class_uid={cls_uid} * 100 + activity_id={activity_value}), "
+                    f"got {provided!r}"
+                )
 
         return data
 
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any
 
 
+# Converted for every model, parent, object reference and enum field name
+@lru_cache(maxsize=4096)
 def snake_to_pascal(name: str) -> str:
     """Convert snake_case to PascalCase.
 
@@ -17,6 +20,14 @@ def snake_to_pascal(name: str) -> str:
     return "".join(word.capitalize() for word in name.split("_"))
 
 
+# ASCII letter classes for pascal_to_snake's word boundaries
+_ASCII_UPPER = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_ASCII_LOWER = frozenset("abcdefghijklmnopqrstuvwxyz")
+_ASCII_LOWER_OR_DIGIT = _ASCII_LOWER | frozenset("0123456789")
+
+
+# Model names form a small, fixed set and are converted on every model lookup
+@lru_cache(maxsize=4096)
 def pascal_to_snake(name: str) -> str:
     """Convert PascalCase to snake_case.
 
@@ -31,13 +42,25 @@ def pascal_to_snake(name: str) -> str:
         APIKey -> api_key
         Finding -> finding
     """
-    # Insert underscores before uppercase letters that follow lowercase letters
-    s1 = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-    # Insert underscores before uppercase letters that follow lowercase or uppercase letters
-    s2 = re.sub("([a-z0-9])([A-Z])", r"\1_\2", s1)
-    return s2.lower()
-
-
+    # One pass over the name: a word starts at an uppercase letter that follows a
+    # lowercase letter or digit, or that begins a capitalised word (the "K" in "APIKey")
+    chars = []
+    prev = ""
+    last = len(name) - 1
+    for i, char in enumerate(name):
+        if (
+            i
+            and char in _ASCII_UPPER
+            and (prev in _ASCII_LOWER_OR_DIGIT or (i < last and name[i + 1] in _ASCII_LOWER))
+        ):
+            chars.append("_")
+        chars.append(char)
+        prev = char
+    return "".join(chars).lower()
+
+
+# Called for every primitive field with only a handful of distinct argument combinations
+@lru_cache(maxsize=1024)
 def ocsf_type_to_python(
     ocsf_type: str,
     is_array: bool = False,
@@ -83,6 +106,14 @@ def ocsf_type_to_python(
     return python_type
 
 
+# Patterns used by label_to_enum_name
+_WS_HYPHEN_RE = re.compile(r"[\s\-]+")
+_NON_IDENT_RE = re.compile(r"[^a-zA-Z0-9_]")
+_MULTI_UNDERSCORE_RE = re.compile(r"_+")
+
+
+# Labels such as "Unknown", "Create" and "Other" repeat across nearly every enum
+@lru_cache(maxsize=4096)
 def label_to_enum_name(label: str) -> str:
     """Convert an enum label to a valid Python enum member name.
 
@@ -100,15 +131,15 @@ def label_to_enum_name(label: str) -> str:
         "Other" -> "OTHER"
     """
     # Replace spaces and hyphens with underscores
-    name = re.sub(r"[\s\-]+", "_", label)
+    name = _WS_HYPHEN_RE.sub("_", label)
     # Remove any other special characters
-    name = re.sub(r"[^a-zA-Z0-9_]", "", name)
+    name = _NON_IDENT_RE.sub("", name)
     # Convert to uppercase
     name = name.upper()
     # Remove leading/trailing underscores
     name = name.strip("_")
     # Collapse multiple underscores
-    name = re.sub(r"_+", "_", name)
+    name = _MULTI_UNDERSCORE_RE.sub("_", name)
 
     # Ensure doesn't start with a number
     if name and name[0].isdigit():
@@ -121,46 +152,10 @@ def label_to_enum_name(label: str) -> str:
     return name
 
 
-def infer_sibling_label_field(id_field: str) -> str:
-    """Infer the sibling label field name for an ID field with an enum.
-
-    Per OCSF specification, sibling attributes follow the pattern where a
-    numeric `_id` field (e.g., activity_id, type_id) has a corresponding
-    string label field. The label field name is inferred by removing the
-    `_id` suffix, with special handling for Python reserved keywords.
-
-    Args:
-        id_field: The ID field name ending in "_id" (e.g., "activity_id", "type_id")
-
-    Returns:
-        The inferred label field name (e.g., "activity", "type_")
-
-    Raises:
-        ValueError: If field name doesn't end with "_id"
-
-    Examples:
-        >>> infer_sibling_label_field("activity_id")
-        "activity"
-        >>> infer_sibling_label_field("type_id")
-        "type_"
-        >>> infer_sibling_label_field("severity_id")
-        "severity"
-        >>> infer_sibling_label_field("class_id")
-        "class_"
-
-    Note:
-        For Python reserved keywords (type, class, import, etc.), an underscore
-        suffix is appended to avoid syntax errors.
-    """
-    if not id_field.endswith("_id"):
-        raise ValueError(f"Expected field ending in '_id', got {id_field!r}")
-
-    # Remove "_id" suffix to get base name
-    base = id_field[:-3]
-
-    # Python reserved keywords that need underscore suffix
-    # This is a comprehensive list of Python 3.x keywords
-    RESERVED_KEYWORDS = {
+# Python reserved keywords that need an underscore suffix as label field names
+# This is a comprehensive list of Python 3.x keywords
+_RESERVED_KEYWORDS = frozenset(
+    {
         "False",
         "None",
         "True",
@@ -198,9 +193,51 @@ def infer_sibling_label_field(id_field: str) -> str:
         "yield",
         "type",
     }
+)
+_RESERVED_KEYWORDS_LOWER = frozenset(keyword.lower() for keyword in _RESERVED_KEYWORDS)
+
+
+# Called for every enum-backed _id field; field names repeat across models
+@lru_cache(maxsize=512)
+def infer_sibling_label_field(id_field: str) -> str:
+    """Infer the sibling label field name for an ID field with an enum.
+
+    Per OCSF specification, sibling attributes follow the pattern where a
+    numeric `_id` field (e.g., activity_id, type_id) has a corresponding
+    string label field. The label field name is inferred by removing the
+    `_id` suffix, with special handling for Python reserved keywords.
+
+    Args:
+        id_field: The ID field name ending in "_id" (e.g., "activity_id", "type_id")
+
+    Returns:
+        The inferred label field name (e.g., "activity", "type_")
+
+    Raises:
+        ValueError: If field name doesn't end with "_id"
+
+    Examples:
+        >>> infer_sibling_label_field("activity_id")
+        "activity"
+        >>> infer_sibling_label_field("type_id")
+        "type_"
+        >>> infer_sibling_label_field("severity_id")
+        "severity"
+        >>> infer_sibling_label_field("class_id")
+        "class_"
+
+    Note:
+        For Python reserved keywords (type, class, import, etc.), an underscore
+        suffix is appended to avoid syntax errors.
+    """
+    if not id_field.endswith("_id"):
+        raise ValueError(f"Expected field ending in '_id', got {id_field!r}")
+
+    # Remove "_id" suffix to get base name
+    base = id_field[:-3]
 
     # Check if base name is a reserved keyword (case-insensitive check)
-    if base in RESERVED_KEYWORDS or base.lower() in {k.lower() for k in RESERVED_KEYWORDS}:
+    if base in _RESERVED_KEYWORDS or base.lower() in _RESERVED_KEYWORDS_LOWER:
         return f"{base}_"
 
     return base
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import contextlib
 from enum import IntEnum
+from functools import cached_property
 from types import ModuleType
 from typing import Any
 
 from ocsf._base import OCSFBaseModel
+from ocsf._import_hook import JIT_PATH_ENTRY
 from ocsf._model_factory import ModelFactory
 from ocsf._schema_loader import get_schema_loader
 
@@ -35,18 +37,24 @@ class OCSFVersionModule(ModuleType):
         self.version = version
         self._model_cache: dict[str, type[OCSFBaseModel]] = {}
         self.__file__ = f"<ocsf-jit:{version}>"
-        self.__path__ = []  # Mark as package
+        self.__path__ = [JIT_PATH_ENTRY]  # Package whose submodules the import hook serves
 
         # Namespace module references
         self._objects_module: Any = None
         self._events_module: Any = None
 
-        # Load schema
-        loader = get_schema_loader()
-        self.schema = loader.load_schema(version)
+    # The schema and model factory are only built when a model is first requested,
+    # so importing a version module (or its namespaces) stays cheap
 
-        # Create model factory
-        self.factory = ModelFactory(self.schema, version)
+    @cached_property
+    def schema(self) -> dict[str, Any]:
+        """Schema for this version, loaded on first use."""
+        return get_schema_loader().load_schema(self.version)
+
+    @cached_property
+    def factory(self) -> ModelFactory:
+        """Model factory for this version, created on first use."""
+        return ModelFactory(self.schema, self.version)
 
     def __getattr__(self, name: str) -> Any:
         """Only expose namespace modules, not individual models.
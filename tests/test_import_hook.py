@@ -13,12 +13,35 @@ class TestImportHook:
     """Test OCSF import hook behavior."""
 
     def test_hook_installed(self):
-        """Verify import hook is installed in sys.meta_path."""
-        from ocsf._import_hook import OCSFImporter
+        """Verify import hook is installed on the ocsf package path."""
+        import ocsf
+        from ocsf._import_hook import JIT_PATH_ENTRY, OCSFImporter
 
-        # Check hook is in meta_path
-        hook_found = any(isinstance(finder, OCSFImporter) for finder in sys.meta_path)
-        assert hook_found, "OCSFImporter not found in sys.meta_path"
+        # Check hook is reachable from the package path, not consulted for every import
+        assert ocsf.__path__[0] == JIT_PATH_ENTRY
+        assert not any(isinstance(finder, OCSFImporter) for finder in sys.meta_path)
+
+    def test_hook_survives_cache_invalidation(self):
+        """Verify the hook's finder is rebuilt after importlib.invalidate_caches()."""
+        import importlib
+        import pkgutil
+
+        from ocsf._import_hook import JIT_PATH_ENTRY, OCSFImporter
+
+        importlib.invalidate_caches()
+        assert isinstance(pkgutil.get_importer(JIT_PATH_ENTRY), OCSFImporter)
+
+    def test_install_hook_idempotent(self):
+        """Verify repeated installs register a single hook and path entry."""
+        import ocsf
+        from ocsf._import_hook import JIT_PATH_ENTRY, install_hook
+
+        num_hooks = len(sys.path_hooks)
+        install_hook()
+        install_hook()
+
+        assert len(sys.path_hooks) == num_hooks
+        assert ocsf.__path__.count(JIT_PATH_ENTRY) == 1
 
     def test_hook_doesnt_break_other_imports(self):
         """Verify hook doesn't interfere with normal imports."""
@@ -117,6 +117,24 @@ class TestModelFactory:
         assert factory._pascal_to_snake("FileActivity") == "file_activity"
         assert factory._pascal_to_snake("ApiActivity") == "api_activity"
 
+    def test_factory_reuses_created_models(self):
+        """Test that the factory builds each model once per namespace filter."""
+        from ocsf._model_factory import ModelFactory
+
+        schema = {
+            "objects": {
+                "object": {"attributes": {}},
+                "thing": {"extends": "object", "attributes": {"name": {"type": "string_t"}}},
+            }
+        }
+        factory = ModelFactory(schema, "1.0.0")
+
+        Thing = factory.create_model("Thing", {}, namespace_filter="objects")
+
+        # A fresh cache still gets the same class, and the parent was reused too
+        assert factory.create_model("Thing", {}, namespace_filter="objects") is Thing
+        assert factory.create_model("Object", {}, namespace_filter="objects") is Thing.__base__
+
     def test_multiple_models_same_cache(self):
         """Test that multiple models share the same cache."""
         import ocsf.v1_7_0
@@ -101,6 +101,16 @@ def test_top_level_namespace_access():
     assert FileActivity is not None
 
 
+def test_top_level_access_cached_in_globals():
+    """Top-level lazy lookups are stored in the package globals."""
+    import ocsf.v1_7_0
+
+    objects = ocsf.objects
+
+    assert vars(ocsf)["objects"] is objects
+    assert objects is ocsf.v1_7_0.objects
+
+
 def test_shared_model_cache():
     """Models are cached in parent module, accessible via namespaces."""
     from ocsf.v1_7_0 import _model_cache
@@ -52,6 +52,47 @@ class TestSchemaBundling:
         # Should return same object (cached)
         assert schema1 is schema2
 
+    def test_has_version(self, tmp_path):
+        """Test version availability checks and their reset on clear_cache."""
+        from ocsf._schema_loader import SchemaLoader
+
+        (tmp_path / "v1_0_0.json").write_text('{"objects": {}}')
+        loader = SchemaLoader(tmp_path)
+
+        assert loader.has_version("1.0.0")
+        assert not loader.has_version("1.7.0")
+
+        (tmp_path / "v1_7_0.json").write_text('{"objects": {}}')
+        assert not loader.has_version("1.7.0")
+
+        loader.clear_cache()
+        assert loader.has_version("1.7.0")
+
+    def test_concurrent_loads_share_schema(self, tmp_path):
+        """Test that concurrent first loads of a version return one parsed schema."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ocsf._schema_loader import SchemaLoader
+
+        (tmp_path / "v1_0_0.json").write_text('{"objects": {}}')
+        loader = SchemaLoader(tmp_path)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            schemas = list(pool.map(lambda _: loader.load_schema("1.0.0"), range(32)))
+
+        assert all(schema is schemas[0] for schema in schemas)
+
+    def test_invalid_json_raises_schema_error(self, tmp_path):
+        """Test that a malformed schema file raises SchemaError."""
+        from ocsf._exceptions import SchemaError
+        from ocsf._schema_loader import SchemaLoader
+
+        (tmp_path / "v1_0_0.json").write_text('{"objects": ')
+        loader = SchemaLoader(tmp_path)
+
+        with pytest.raises(SchemaError, match="Invalid JSON"):
+            loader.load_schema("1.0.0")
+
     def test_checksum_validation(self):
         """Test checksum validation if implemented."""
         from ocsf._schema_loader import get_schema_loader